@@ -0,0 +1,29 @@
+from time import perf_counter
+from sqlton import parse
+from sqlton.analysis import analyze, dependencies
+from benchmarks.corpus import oltp
+
+
+def measure(function, inputs):
+    start = perf_counter()
+    for entry in inputs:
+        function(entry)
+    return len(inputs) / (perf_counter() - start)
+
+
+def main():
+    texts = list(oltp(2000))
+    trees = [parse(text)[0] for text in texts]
+
+    walked = measure(analyze, trees)
+    measure(dependencies, trees)
+    memoized = measure(dependencies, trees)
+    parsed = measure(lambda text: [analyze(tree) for tree in parse(text)], texts)
+    keyed = measure(dependencies, texts)
+
+    print(f'trees: walk {walked:12,.0f} stmt/s, memoized {memoized:12,.0f} stmt/s ({memoized / walked:.0f}x)')
+    print(f'text:  parse and walk {parsed:12,.0f} stmt/s, token key {keyed:12,.0f} stmt/s ({keyed / parsed:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+from os import cpu_count
+from time import perf_counter
+from sqlton.batch import parse_many
+
+
+def statements(count):
+    for index in range(count):
+        yield (f'select person.id, person.name, count(*) from person '
+               f'left join address on person.id = address.person_id '
+               f'where person.age > {index % 90} and person.name like "A%" '
+               f'group by person.id order by person.name limit {index % 50 + 1}')
+
+
+def main(count=20000):
+    baseline = None
+
+    for workers in range(1, (cpu_count() or 1) + 1):
+        for ordered in (True, False):
+            start = perf_counter()
+            parsed = sum(1 for _ in parse_many(statements(count), workers=workers, ordered=ordered))
+            rate = parsed / (perf_counter() - start)
+            baseline = baseline or rate
+
+            print(f'{workers:3d} workers ({"ordered" if ordered else "unordered"}): '
+                  f'{rate:10,.0f} statements/s ({rate / baseline:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+from time import perf_counter
+from sqlton import parse
+from sqlton.bulk import parse_insert
+from benchmarks.corpus import insert_batches
+
+
+def measure(function, statements):
+    start = perf_counter()
+    for statement in statements:
+        function(statement)
+    return perf_counter() - start
+
+
+def main():
+    for rows in (100, 1000, 10000):
+        statements = list(insert_batches(5, rows))
+        grammar = measure(parse, statements)
+        bulk = measure(parse_insert, statements)
+        print(f'{rows:6d} rows: grammar {5 * rows / grammar:12,.0f} rows/s, '
+              f'bulk {5 * rows / bulk:12,.0f} rows/s ({grammar / bulk:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+from time import perf_counter
+from sqlton.classify import classify, split
+from sqlton.parser import Lexer
+from sqlton.pool import ParserPool
+from benchmarks.corpus import corpora
+
+sizes = {'oltp': (2000,), 'insert_batches': (5, 1000), 'nested': (10, 20), 'where_chains': (5, 200)}
+
+
+def measure(function, texts):
+    start = perf_counter()
+    results = [function(text) for text in texts]
+    return perf_counter() - start, results
+
+
+def main():
+    lexer = Lexer()
+    pool = ParserPool(on_error='raise')
+
+    for name, corpus in corpora.items():
+        texts = list(corpus(*sizes[name]))
+        script = ';\n'.join(texts)
+
+        parsing, trees = measure(pool.parse, texts)
+        lexing, _ = measure(lambda text: sum(1 for _ in lexer.tokenize(text)), texts)
+        classifying, kinds = measure(classify, texts)
+
+        assert kinds == [tuple(map(type, tree)) for tree in trees]
+        assert split(script) == tuple(texts)
+
+        print(f'{name:15} parse {parsing * 1000:9.1f} ms, tokenize {lexing * 1000:9.1f} ms, '
+              f'classify {classifying * 1000:8.1f} ms ({parsing / classifying:5.1f}x parse)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+def oltp(count=200):
+    for index in range(count):
+        yield (f'select id, name, email from person where id = {index}',
+               f'select * from orders where customer_id = {index} and status = "open" order by created desc limit 20',
+               f'update person set email = "user{index}@example.com" where id = {index}',
+               f'delete from session where token = "{index:032x}"',
+               f'insert into audit (person_id, action, at) values ({index}, "login", current_timestamp)')[index % 5]
+
+
+def insert_batches(count=10, rows=1000):
+    for batch in range(count):
+        yield ('insert into measurement (sensor, at, value, unit) values ' +
+               ', '.join(f'({row % 17}, {batch * rows + row}, {row * 0.25}, "celsius")'
+                         for row in range(rows)))
+
+
+def nested(count=20, depth=30):
+    for index in range(count):
+        ctes = ', '.join(f'c{level} as (select c{level - 1}.id, c{level - 1}.total + {level} as total '
+                         f'from c{level - 1} join person on person.id = c{level - 1}.id '
+                         f'where c{level - 1}.total > {index})'
+                         for level in range(1, depth))
+        yield (f'with c0 as (select id, 0 as total from person), {ctes} '
+               f'select * from c{depth - 1} left join orders on orders.person_id = c{depth - 1}.id '
+               f'order by total desc limit 10')
+
+
+def where_chains(count=20, terms=500):
+    for index in range(count):
+        yield ('select * from event where ' +
+               ' and '.join(f'(kind = {term} or source like "s{term}%" or at between {term} and {term + index})'
+                            for term in range(terms)))
+
+
+corpora = {'oltp': oltp,
+           'insert_batches': insert_batches,
+           'nested': nested,
+           'where_chains': where_chains}
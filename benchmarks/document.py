@@ -0,0 +1,28 @@
+from time import perf_counter
+from sqlton import parse
+from sqlton.document import Document
+from benchmarks.corpus import oltp
+
+
+def main(edits=200):
+    text = ';\n'.join(oltp(500))
+    document = Document(text)
+
+    start = perf_counter()
+    for index in range(edits):
+        position = document.text.index(' ', document.spans[index * 2][0] + 1)
+        document.apply_edit((position, position), ' ')
+    incremental = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(edits // 20):
+        parse(document.text)
+    full = (perf_counter() - start) * 20
+
+    print(f'{len(document.statements)} statements, {edits} edits: '
+          f'incremental {incremental * 1000:8.1f} ms, full reparse {full * 1000:8.1f} ms '
+          f'({full / incremental:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
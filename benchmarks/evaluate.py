@@ -0,0 +1,74 @@
+from random import Random
+from time import perf_counter
+from sqlton import parse
+from sqlton.ast import Operation, Column
+from sqlton.evaluate import predicate
+
+condition = ("price between 10 and 500 and (category in ('book', 'music', 'film') "
+             "or name like 'the %') and stock * 2 > reserved and discount is null")
+
+comparisons = {'=': lambda a, b: a == b, '<>': lambda a, b: a != b,
+               '<': lambda a, b: a < b, '<=': lambda a, b: a <= b,
+               '>': lambda a, b: a > b, '>=': lambda a, b: a >= b}
+
+
+def interpret(node, row):
+    if isinstance(node, Column):
+        return row[node.name]
+
+    if not isinstance(node, Operation):
+        return node
+
+    operator = node.operator
+
+    if operator == ('AND',):
+        return interpret(node.a, row) and interpret(node.b, row)
+    if operator == ('OR',):
+        return interpret(node.a, row) or interpret(node.b, row)
+    if operator == ('IS',):
+        return interpret(node.a, row) is None
+    if operator == ('IN',):
+        return interpret(node.a, row) in [interpret(value, row) for value in node.b]
+    if operator == ('LIKE',):
+        return interpret(node.a, row).lower().startswith(node.b[:-1].lower())
+
+    a, b = interpret(node.a, row), interpret(node.b, row)
+
+    if operator == ('*',):
+        return a * b
+
+    return comparisons[operator[0]](a, b)
+
+
+def records(count):
+    random = Random(7)
+    return [{'price': random.randrange(1000),
+             'category': random.choice(('book', 'music', 'film', 'food', 'toy')),
+             'name': random.choice(('the wall', 'a tale', 'The End', 'nothing')),
+             'stock': random.randrange(100),
+             'reserved': random.randrange(100),
+             'discount': random.choice((None, 5))}
+            for _ in range(count)]
+
+
+def main():
+    rows = records(200_000)
+    where = parse(f'select * from t where {condition}')[0].select_core.where
+
+    start = perf_counter()
+    interpreted = [row for row in rows if interpret(where, row)]
+    interpreting = perf_counter() - start
+
+    start = perf_counter()
+    test = predicate(where)
+    compiled = [row for row in rows if test(row)]
+    compiling = perf_counter() - start
+
+    assert interpreted == compiled
+
+    print(f'{len(rows):,} rows: interpreted {interpreting * 1000:8.1f} ms, '
+          f'compiled {compiling * 1000:8.1f} ms ({interpreting / compiling:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+from random import Random
+from time import perf_counter
+from tracemalloc import start as trace, stop as untrace, get_traced_memory
+from sqlton.execute import execute
+
+
+def orders(count):
+    random = Random(7)
+    for number in range(count):
+        yield {'id': number,
+               'customer': random.randrange(1000),
+               'amount': random.randrange(1, 500),
+               'status': random.choice(('open', 'paid', 'void'))}
+
+
+customers = [{'id': number, 'region': ('north', 'south', 'east', 'west')[number % 4]}
+             for number in range(1000)]
+
+queries = {'scan':      "select id, amount from orders where status = 'paid' and amount > 250",
+           'limit':     "select id from orders where amount > 490 limit 10",
+           'aggregate': "select customer, count(*), sum(amount) from orders group by customer",
+           'join':      "select c.region, sum(o.amount) from orders as o join customers as c "
+                        "on o.customer = c.id group by c.region",
+           'top-n':     "select id, amount from orders order by amount desc, id limit 10",
+           'sort':      "select id, amount from orders order by amount desc, id"}
+
+
+def run(query, count):
+    return sum(1 for _ in execute(query, {'orders': lambda: orders(count),
+                                          'customers': customers}))
+
+
+def main(count=200_000, traced=50_000):
+    for name, query in queries.items():
+        start = perf_counter()
+        produced = run(query, count)
+        elapsed = perf_counter() - start
+
+        trace()
+        run(query, traced)
+        peak = get_traced_memory()[1]
+        untrace()
+
+        print(f'{name:10} {produced:8,} rows {elapsed * 1000:9.1f} ms '
+              f'({count / elapsed:10,.0f} input rows/s), '
+              f'peak {peak / 1024:9,.0f} KiB over {traced:,} rows')
+
+
+if __name__ == '__main__':
+    main()
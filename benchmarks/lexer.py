@@ -0,0 +1,48 @@
+from time import perf_counter
+from sqlton.parser import Lexer, insensitive, keywords
+
+
+def regex_lexer():
+    namespace = type(Lexer).__prepare__('RegexLexer', (Lexer,))
+    namespace['tokens'] = Lexer.tokens
+
+    for word, kind in keywords.items():
+        if word == kind:
+            namespace[word] = namespace['before']('IDENTIFIER', insensitive(word))
+
+    return type(Lexer)('RegexLexer', (Lexer,), namespace)
+
+
+def statement(columns):
+    return ('select ' +
+            ', '.join(f'person.column_{index} as alias_{index}' for index in range(columns)) +
+            ' from person left outer join address on person.id = address.person_id' +
+            ' where ' +
+            ' and '.join(f'column_{index} between {index} and {index * 10}' for index in range(columns)) +
+            ' order by column_0 desc limit 10 offset 5')
+
+
+def measure(lexer, text, repeat):
+    start = perf_counter()
+    for _ in range(repeat):
+        count = sum(1 for _ in lexer().tokenize(text))
+    return count * repeat / (perf_counter() - start)
+
+
+def main(repeat=50):
+    RegexLexer = regex_lexer()
+
+    for columns in (10, 50, 200):
+        text = statement(columns)
+        assert ([(token.type, token.value) for token in Lexer().tokenize(text)] ==
+                [(token.type, token.value) for token in RegexLexer().tokenize(text)])
+
+        legacy = measure(RegexLexer, text, repeat)
+        keyword = measure(Lexer, text, repeat)
+
+        print(f'{len(text):7d} bytes: regex {legacy:12,.0f} tokens/s, '
+              f'keyword table {keyword:12,.0f} tokens/s ({keyword / legacy:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
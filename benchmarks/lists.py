@@ -0,0 +1,35 @@
+from time import perf_counter
+from sqlton import parse
+
+
+shapes = {'select columns': lambda n: 'select ' + ', '.join(f'c{i}' for i in range(n)) + ' from t',
+          'create columns': lambda n: 'create table t (' + ', '.join(f'c{i} integer' for i in range(n)) + ')',
+          'insert rows': lambda n: 'insert into t values ' + ', '.join(f'({i})' for i in range(n)),
+          'in list': lambda n: 'select * from t where a in (' + ', '.join(str(i) for i in range(n)) + ')',
+          'order by': lambda n: 'select * from t order by ' + ', '.join(f'c{i}' for i in range(n)),
+          'statements': lambda n: '; '.join('select 1' for _ in range(n))}
+
+
+def measure(statement, repeat=3):
+    best = None
+
+    for _ in range(repeat):
+        start = perf_counter()
+        parse(statement)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def main():
+    sizes = (250, 1000, 4000)
+
+    for name, shape in shapes.items():
+        figures = [measure(shape(size)) / size * 1e6 for size in sizes]
+        print(f'{name:15s} ' + ' '.join(f'{size:5d}: {figure:7.2f} us/item' for size, figure in zip(sizes, figures)) +
+              f' (growth {figures[-1] / figures[0]:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+from importlib import import_module
+
+def execute_benchmark(module):
+    module = import_module(module)
+    print(f'-- {module.__name__}:\n')
+    module.main()
+    print('')
+
+def all():
+    execute_benchmark('benchmarks.startup')
+    execute_benchmark('benchmarks.lexer')
+    execute_benchmark('benchmarks.throughput')
+    execute_benchmark('benchmarks.memory')
+    execute_benchmark('benchmarks.visit')
+    execute_benchmark('benchmarks.pool')
+    execute_benchmark('benchmarks.batch')
+    execute_benchmark('benchmarks.bulk')
+    execute_benchmark('benchmarks.lists')
+    execute_benchmark('benchmarks.numbers')
+    execute_benchmark('benchmarks.document')
+    execute_benchmark('benchmarks.positions')
+    execute_benchmark('benchmarks.analysis')
+    execute_benchmark('benchmarks.evaluate')
+    execute_benchmark('benchmarks.vectorize')
+    execute_benchmark('benchmarks.execute')
+    execute_benchmark('benchmarks.classify')
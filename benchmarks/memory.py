@@ -0,0 +1,51 @@
+from time import perf_counter
+from tracemalloc import start, stop, take_snapshot
+from sqlton.pool import ParserPool
+
+
+def statements(count):
+    for index in range(count):
+        yield (f'select id, name from person where id = {index} limit 1',
+               f'insert into person (id, name) values ({index}, "name {index}")',
+               f'update person set name = "name {index}" where id = {index}',
+               f'delete from person where id = {index}',
+               f'select person.id, team.name from person join team on person.team = team.id '
+               f'where person.age > {index % 90} and team.kind in (1, 2) order by person.id')[index % 5]
+
+
+def measure(count, intern=False):
+    texts = list(statements(count))
+    pool = ParserPool(intern=intern)
+
+    start()
+    before = take_snapshot()
+    trees = [pool.parse(text) for text in texts]
+    after = take_snapshot()
+    stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return size, trees
+
+
+def compare(trees):
+    wheres = [tree[0].select_core.where for tree in trees[4::5]]
+
+    begin = perf_counter()
+    for left, right in zip(wheres, wheres[1:]):
+        left.b == right.b
+    return perf_counter() - begin
+
+
+def main(count=20000):
+    plain, plain_trees = measure(count)
+    interned, interned_trees = measure(count, intern=True)
+
+    print(f'{count} statements held: {plain / 2 ** 20:8.2f} MiB, {plain / count:6.0f} bytes/statement')
+    print(f'{count} statements interned: {interned / 2 ** 20:8.2f} MiB, {interned / count:6.0f} bytes/statement '
+          f'({1 - interned / plain:.0%} less)')
+    print(f'equal subtree comparison: {compare(plain_trees) * 1e6:8.0f} us plain, '
+          f'{compare(interned_trees) * 1e6:8.0f} us interned')
+
+
+if __name__ == '__main__':
+    main()
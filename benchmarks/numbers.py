@@ -0,0 +1,24 @@
+from time import perf_counter
+from sqlton.parser import Lexer
+from benchmarks.corpus import insert_batches
+
+
+def measure(lexer, texts):
+    start = perf_counter()
+    for text in texts:
+        for _ in lexer.tokenize(text):
+            pass
+    return perf_counter() - start
+
+
+def main():
+    texts = list(insert_batches(10, 2000))
+    eager = measure(Lexer(), texts)
+    lazy = measure(Lexer(lazy_numbers=True), texts)
+
+    print(f'eager numbers {eager * 1000:8.1f} ms, lazy numbers {lazy * 1000:8.1f} ms '
+          f'({eager / lazy:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
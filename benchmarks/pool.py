@@ -0,0 +1,39 @@
+from time import perf_counter
+from threading import Thread
+from sqlton import ParserPool
+from sqlton.parser import Lexer, Parser
+from benchmarks.corpus import oltp
+
+
+def fresh(statement):
+    return Parser().parse(Lexer().tokenize(statement))
+
+
+def measure(parse, statements, threads):
+    def work():
+        for statement in statements:
+            parse(statement)
+
+    workers = [Thread(target=work) for _ in range(threads)]
+    start = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return len(statements) * threads / (perf_counter() - start)
+
+
+def main():
+    statements = list(oltp(1000))
+    pool = ParserPool()
+
+    for threads in (1, 4, 16):
+        constructed = measure(fresh, statements, threads)
+        pooled = measure(pool.parse, statements, threads)
+        print(f'{threads:3d} threads: per-call construction {constructed:10,.0f} stmt/s, '
+              f'pool {pooled:10,.0f} stmt/s ({pooled / constructed:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
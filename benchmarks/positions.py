@@ -0,0 +1,40 @@
+from time import perf_counter
+from sqlton.parser import Lexer, Parser
+from sqlton.visit import walk
+from benchmarks.corpus import corpora
+
+
+def parse(parser, tokens):
+    for entry in tokens:
+        parser.parse(iter(entry))
+
+
+def resolve(parser, tokens):
+    for entry in tokens:
+        statements = parser.parse(iter(entry))
+        for node in walk(statements):
+            parser.positions.get(node)
+
+
+def main(repeat=5):
+    for name, corpus in corpora.items():
+        tokens = [list(Lexer().tokenize(text)) for text in corpus()]
+        cases = {'off': (parse, Parser()),
+                 'on': (parse, Parser(positions=True)),
+                 'resolved': (resolve, Parser(positions=True))}
+        best = dict.fromkeys(cases, float('inf'))
+
+        for _ in range(repeat):
+            for case, (function, parser) in cases.items():
+                start = perf_counter()
+                function(parser, tokens)
+                best[case] = min(best[case], perf_counter() - start)
+
+        print(f"{name:15s} off {best['off'] * 1000:9.1f} ms, "
+              f"on {best['on'] * 1000:9.1f} ms ({(best['on'] / best['off'] - 1) * 100:+.1f}%), "
+              f"every span read {best['resolved'] * 1000:9.1f} ms "
+              f"({(best['resolved'] / best['off'] - 1) * 100:+.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+from sys import executable
+from os import environ
+from subprocess import run
+from tempfile import TemporaryDirectory
+from os.path import join
+from time import perf_counter
+from statistics import median
+
+
+def import_time(tables, repeat=5, module='sqlton.parser'):
+    environment = dict(environ, SQLTON_TABLES=tables)
+    durations = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        run((executable, '-c', f'import {module}'), env=environment, check=True)
+        durations.append(perf_counter() - start)
+
+    return median(durations)
+
+
+def main():
+    with TemporaryDirectory() as directory:
+        tables = join(directory, 'parsetab.pickle')
+
+        cold = import_time('')
+        import_time(tables, repeat=1)
+        warm = import_time(tables)
+        package = import_time(tables, module='sqlton')
+
+    print(f'import without persisted tables: {cold * 1000:8.1f} ms')
+    print(f'import with persisted tables:    {warm * 1000:8.1f} ms')
+    print(f'speedup: {cold / warm:.1f}x')
+    print(f'import sqlton with persisted tables: {package * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+from sys import argv
+from json import dump, load
+from time import perf_counter
+from platform import python_version
+from tracemalloc import start, stop, get_traced_memory, reset_peak
+from statistics import quantiles, median
+import sqlton
+from sqlton.parser import Lexer, Parser
+from benchmarks.corpus import corpora
+
+
+def tokenize(text):
+    return list(Lexer().tokenize(text))
+
+
+def stages(texts):
+    tokens = [tokenize(text) for text in texts]
+
+    return {'tokenize': (tokenize, texts),
+            'parse': (lambda tokens: Parser().parse(iter(tokens)), tokens),
+            'end_to_end': (sqlton.parse, texts)}
+
+
+def measure(function, inputs, token_count):
+    latencies = []
+
+    for entry in inputs:
+        begin = perf_counter()
+        function(entry)
+        latencies.append(perf_counter() - begin)
+
+    start()
+    reset_peak()
+    for entry in inputs:
+        function(entry)
+    peak = get_traced_memory()[1]
+    stop()
+
+    total = sum(latencies)
+    percentiles = quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+
+    return {'statements_per_second': len(inputs) / total,
+            'tokens_per_second': token_count / total,
+            'p50_ms': median(latencies) * 1000,
+            'p99_ms': percentiles[98] * 1000,
+            'peak_memory_bytes': peak}
+
+
+def run():
+    results = {'python': python_version(), 'sqlton': {}}
+
+    for name, corpus in corpora.items():
+        texts = list(corpus())
+        token_count = sum(len(tokenize(text)) for text in texts)
+
+        results['sqlton'][name] = {stage: measure(function, inputs, token_count)
+                                   for stage, (function, inputs) in stages(texts).items()}
+
+    return results
+
+
+def report(results, baseline=None):
+    for name, corpus in results['sqlton'].items():
+        print(name)
+
+        for stage, figures in corpus.items():
+            line = (f"  {stage:11s} {figures['statements_per_second']:12,.1f} stmt/s "
+                    f"{figures['tokens_per_second']:12,.0f} tok/s "
+                    f"p50 {figures['p50_ms']:9.3f} ms p99 {figures['p99_ms']:9.3f} ms "
+                    f"peak {figures['peak_memory_bytes'] / 2 ** 20:8.2f} MiB")
+
+            if baseline is not None and stage in baseline['sqlton'].get(name, {}):
+                previous = baseline['sqlton'][name][stage]['statements_per_second']
+                line += f" ({figures['statements_per_second'] / previous:5.2f}x)"
+
+            print(line)
+
+
+def main(arguments=None):
+    arguments = argv[1:] if arguments is None else arguments
+    output = arguments[0] if arguments else None
+    baseline = None
+
+    if len(arguments) > 1:
+        with open(arguments[1]) as file:
+            baseline = load(file)
+
+    results = run()
+    report(results, baseline)
+
+    if output is not None:
+        with open(output, 'w') as file:
+            dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+from sys import argv
+from time import perf_counter
+from sqlton import parse
+from sqlton.evaluate import predicate
+from sqlton.vectorize import mask
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+condition = ('price between 10 and 500 and category in (1, 2, 3) '
+             'and stock * 2 > reserved and discount is null')
+
+
+def batch(count):
+    random = numpy.random.default_rng(7)
+    return {'price': random.integers(0, 1000, count),
+            'category': random.integers(0, 5, count),
+            'stock': random.integers(0, 100, count),
+            'reserved': random.integers(0, 100, count),
+            'discount': numpy.ma.array(random.integers(0, 10, count),
+                                       mask=random.integers(0, 2, count).astype(bool))}
+
+
+def records(columns, count):
+    names = list(columns)
+    values = [columns[name][:count].tolist() for name in names]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def main(count=10_000_000, sample=1_000_000):
+    if numpy is None:
+        print('numpy is not installed')
+        return
+
+    columns = batch(count)
+    where = parse(f'select * from t where {condition}')[0].select_core.where
+
+    start = perf_counter()
+    selected = mask(where, columns)
+    vectorized = perf_counter() - start
+
+    rows = records(columns, sample)
+    test = predicate(where)
+
+    start = perf_counter()
+    matches = [test(row) for row in rows]
+    per_row = perf_counter() - start
+
+    assert matches == selected[:sample].tolist()
+
+    print(f'vectorized {count:,} rows {vectorized * 1000:8.1f} ms ({count / vectorized:14,.0f} rows/s)')
+    print(f'per row    {sample:,} rows {per_row * 1000:8.1f} ms ({sample / per_row:14,.0f} rows/s), '
+          f'{count / vectorized / (sample / per_row):.0f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, argv[1:]))
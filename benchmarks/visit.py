@@ -0,0 +1,38 @@
+from time import perf_counter
+from sqlton import parse
+from sqlton.ast import Column
+from sqlton.visit import Visitor, Transformer, walk
+
+
+class Count(Visitor):
+    def __init__(self):
+        self.columns = 0
+
+    def visit_Column(self, node):
+        self.columns += 1
+
+
+class Rename(Transformer):
+    def transform_Column(self, node):
+        return Column(node.name.upper(), node.table)
+
+
+def measure(label, function, nodes, repeat=5):
+    start = perf_counter()
+    for _ in range(repeat):
+        function()
+    print(f'{label:12s} {nodes * repeat / (perf_counter() - start):12,.0f} nodes/s')
+
+
+def main(depth=10000):
+    ast, = parse('select * from t where ' + ' and '.join(f'c{index} = {index}' for index in range(depth)))
+    nodes = sum(1 for _ in walk(ast))
+    print(f'{depth}-deep AND chain, {nodes} nodes')
+
+    measure('walk', lambda: sum(1 for _ in walk(ast)), nodes)
+    measure('Visitor', lambda: Count().visit(ast), nodes)
+    measure('Transformer', lambda: Rename().transform(ast), nodes)
+
+
+if __name__ == '__main__':
+    main()
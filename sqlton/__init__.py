@@ -1,9 +1,33 @@
+from importlib import import_module
 from sqlton.parser import Lexer, Parser
+from sqlton.errors import SqltonSyntaxError
+from sqlton.ast import bind
+from sqlton.cache import ParseCache
+from sqlton.stream import parse_stream
+from sqlton.classify import classify, split
+from sqlton.document import Document
+from sqlton.unparse import unparse
+from sqlton.fingerprint import fingerprint, token_fingerprint
+from sqlton.evaluate import evaluator, predicate
+from sqlton.execute import execute
+from sqlton.bulk import parse_insert
+from sqlton.pool import ParserPool
 
-def parse(statement):
-    lexer = Lexer()
+lazy = {'parse_many': 'sqlton.batch',
+        'parse_async': 'sqlton.aio'}
 
-    tokens = lexer.tokenize(statement)
-    parser = Parser()
-    
-    return parser.parse(tokens)
+def __getattr__(name):
+    if name not in lazy:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return getattr(import_module(lazy[name]), name)
+
+pools = {mode: ParserPool(on_error=mode) for mode in ('print', 'raise', 'recover')}
+pool = pools['print']
+
+def parse(statement, on_error='print'):
+    return pools[on_error].parse(statement)
+
+def parse_script(script):
+    with pools['recover'].acquire() as (lexer, parser):
+        return parser.parse(lexer.tokenize(script)), parser.errors
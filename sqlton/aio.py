@@ -0,0 +1,70 @@
+from asyncio import get_running_loop
+from functools import partial
+from time import perf_counter
+from sqlton.pool import ParserPool
+
+pool = ParserPool()
+
+_pending = {}
+
+
+def _parse_batch(statements):
+    results = []
+
+    for statement in statements:
+        try:
+            results.append((pool.parse(statement), None))
+        except Exception as error:
+            results.append((None, error))
+
+    return results
+
+
+def _flush(loop, executor):
+    batch = _pending.pop((loop, executor))
+    job = loop.run_in_executor(executor, _parse_batch, [statement for statement, _ in batch])
+    job.add_done_callback(partial(_dispatch, [future for _, future in batch]))
+
+
+def _dispatch(futures, job):
+    if job.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+
+    if job.exception() is not None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(job.exception())
+        return
+
+    for future, (result, error) in zip(futures, job.result()):
+        if future.done():
+            continue
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+async def parse_async(statement, executor=None, inline_threshold=1 << 14, on_block=None):
+    loop = get_running_loop()
+
+    if len(statement) <= inline_threshold:
+        start = perf_counter()
+        try:
+            return pool.parse(statement)
+        finally:
+            if on_block is not None:
+                on_block(perf_counter() - start)
+
+    future = loop.create_future()
+    batch = _pending.get((loop, executor))
+
+    if batch is None:
+        batch = _pending[loop, executor] = []
+        loop.call_soon(_flush, loop, executor)
+
+    batch.append((statement, future))
+    return await future
@@ -0,0 +1,143 @@
+from collections import namedtuple, OrderedDict
+from threading import Lock
+from weakref import WeakKeyDictionary
+from sqlton.ast import (Statement, Insert, Replace, Update, Delete, Create, Drop,
+                        Table, Column, All, Alias, Index)
+from sqlton.visit import children
+from sqlton.fingerprint import normalize_tokens
+from sqlton.pool import ParserPool
+
+Dependencies = namedtuple('Dependencies', ('reads', 'writes', 'columns'))
+
+EMPTY = Dependencies(frozenset(), frozenset(), frozenset())
+
+_statements = WeakKeyDictionary()
+_texts = OrderedDict()
+_lock = Lock()
+_pool = ParserPool(on_error='raise')
+
+maxsize = 4096
+
+LEAVE = object()
+
+
+def target(node):
+    while isinstance(node, (Alias, Index)):
+        node = node[0]
+
+    return node if isinstance(node, Table) else None
+
+
+def targets(statement):
+    if isinstance(statement, (Insert, Replace, Update, Delete)):
+        return (target(statement.target),)
+
+    if isinstance(statement, (Create, Drop)):
+        return (statement.table,)
+
+    return ()
+
+
+def assigned(statement, table):
+    if isinstance(statement, (Insert, Replace)) and isinstance(statement.columns, tuple):
+        return (Column(name, table) for name in statement.columns if isinstance(name, str))
+
+    if isinstance(statement, Update):
+        return (Column(name, table) for names, _ in statement.assignments for name in names)
+
+    return ()
+
+
+def roots(statement):
+    if isinstance(statement, (Insert, Replace, Update, Delete)):
+        return [value for key, value in statement._asdict().items() if key != 'target']
+
+    if isinstance(statement, (Create, Drop)):
+        return [value for key, value in statement._asdict().items() if key != 'table']
+
+    return [statement]
+
+
+def ctes(node):
+    with_clause = getattr(node, 'with_clause', None)
+    return () if with_clause is None else [cte.name for cte in with_clause.ctes]
+
+
+def analyze(statement):
+    written = [table for table in targets(statement) if table is not None]
+    reads = set()
+    columns = set()
+    scopes = [frozenset(ctes(statement))]
+
+    for table in written:
+        columns.update(assigned(statement, table))
+
+    stack = list(reversed(roots(statement)))
+
+    while stack:
+        node = stack.pop()
+        kind = type(node)
+
+        if kind is Column:
+            columns.add(node)
+        elif kind is Table:
+            if node.schema_name is not None or node.name not in scopes[-1]:
+                reads.add(node)
+        elif node is LEAVE:
+            scopes.pop()
+        elif kind is not All:
+            if isinstance(node, Statement) and node is not statement and ctes(node):
+                scopes.append(scopes[-1].union(ctes(node)))
+                stack.append(LEAVE)
+
+            stack.extend(reversed(children(node)))
+
+    return Dependencies(frozenset(reads), frozenset(written), frozenset(columns))
+
+
+def dependencies(node):
+    if isinstance(node, str):
+        return _text(node)
+
+    if isinstance(node, tuple) and not hasattr(node, '_fields'):
+        return merge(map(dependencies, node))
+
+    if not isinstance(node, Statement):
+        return analyze(node)
+
+    result = _statements.get(node)
+
+    if result is None:
+        result = _statements[node] = analyze(node)
+
+    return result
+
+
+def merge(results):
+    reads, writes, columns = set(), set(), set()
+
+    for result in results:
+        reads |= result.reads
+        writes |= result.writes
+        columns |= result.columns
+
+    return Dependencies(frozenset(reads), frozenset(writes), frozenset(columns))
+
+
+def _text(statement):
+    key = normalize_tokens(statement)
+
+    with _lock:
+        result = _texts.get(key)
+        if result is not None:
+            _texts.move_to_end(key)
+            return result
+
+    result = merge(map(analyze, _pool.parse(statement)))
+
+    with _lock:
+        _texts[key] = result
+        while len(_texts) > maxsize:
+            _texts.popitem(last=False)
+
+    return result
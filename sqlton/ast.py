@@ -1,52 +1,60 @@
 from itertools import chain
 from collections import namedtuple 
+from collections.abc import Mapping
+from sqlton.visit import rewrite
 
 Operation = namedtuple('Operation', ('operator', 'a', 'b'))
 
 class __Container:
+    __slots__ = ('__weakref__',)
+
     def __init__(self, **kwargs):
-        self.__attrs = set(kwargs.keys())
         for key, value in kwargs.items():
             setattr(self, key, value)
 
     def __repr__(self):
-        return f"{type(self).__name__}({', '.join(key + '=' + repr(getattr(self, key)) for key in self.__attrs)})"
+        return f"{type(self).__name__}({', '.join(key + '=' + repr(value) for key, value in self._asdict().items())})"
+
+    def _asdict(self):
+        return {key: getattr(self, key)
+                for key in self.__slots__
+                if hasattr(self, key)}
 
 
 class Statement(__Container):
-    pass
+    __slots__ = ()
 
 
 class Create(Statement):
-    pass
+    __slots__ = ('table', 'select', 'columns', 'constraints')
 
 
 class Drop(Statement):
-    pass
+    __slots__ = ('if_exists', 'table')
 
 
 class Select(Statement):
-    pass
+    __slots__ = ('with_clause', 'select_core', 'order_by', 'limit')
 
 
 class Insert(Statement):
-    pass
+    __slots__ = ('with_clause', 'alternative', 'target', 'columns', 'values', 'upsert', 'returns')
 
 
 class Replace(Statement):
-    pass
+    __slots__ = ('with_clause', 'alternative', 'target', 'columns', 'values', 'upsert', 'returns')
 
 
 class Update(Statement):
-    pass
+    __slots__ = ('with_clause', 'alternative', 'target', 'assignments', 'tables', 'where', 'returns')
 
 
 class Delete(Statement):
-    pass
+    __slots__ = ('with_clause', 'target', 'where', 'returns')
 
 
 class SelectCore(__Container):
-    pass
+    __slots__ = ('reduction', 'result_column_list', 'table_list', 'where', 'group', 'having')
 
 
 With = namedtuple('With', ('ctes',))
@@ -64,3 +72,44 @@ All = namedtuple('All', ('table',), defaults=(None,))
 Alias = namedtuple('Alias', ('original', 'replacement'))
 
 Values = namedtuple('Values', ('values'))
+
+ColumnarValues = namedtuple('ColumnarValues', ('columns',))
+
+Parameter = namedtuple('Parameter', ('name', 'index'), defaults=(None,))
+
+
+def duplicate(node):
+    if isinstance(node, dict):
+        return dict(node)
+
+    if isinstance(node, (Statement, SelectCore)):
+        return type(node)(**node._asdict())
+
+    return node
+
+
+def substitute(node, kind, replace):
+    return rewrite(node,
+                   lambda node: replace(node) if isinstance(node, kind) else node,
+                   duplicate)
+
+
+def bind(node, parameters):
+    if isinstance(parameters, Mapping):
+        def value(parameter):
+            if parameter.name in parameters or not isinstance(parameter.name, str):
+                return parameters[parameter.name]
+
+            return parameters[parameter.name[1:]]
+
+        return substitute(node, Parameter, value)
+
+    def value(parameter):
+        index = parameter.name if parameter.index is None else parameter.index
+
+        if index < 1:
+            raise IndexError(f'parameter index {index} out of range')
+
+        return parameters[index - 1]
+
+    return substitute(node, Parameter, value)
@@ -0,0 +1,39 @@
+from os import cpu_count
+from collections import namedtuple
+from multiprocessing import Pool
+from sqlton.parser import Lexer, Parser
+from sqlton.errors import SqltonSyntaxError
+
+Result = namedtuple('Result', ('index', 'ast', 'error'))
+
+_lexer = None
+_parser = None
+
+
+def _initialize():
+    global _lexer, _parser
+    _lexer = Lexer()
+    _parser = Parser(on_error='raise')
+
+
+def _parse(entry):
+    index, statement = entry
+
+    try:
+        return Result(index, _parser.parse(_lexer.tokenize(statement)), None)
+    except SqltonSyntaxError as error:
+        return Result(index, None, error)
+
+
+def parse_many(iterable, workers=None, chunksize=256, ordered=True):
+    workers = (cpu_count() or 1) if workers is None else workers
+    entries = enumerate(iterable)
+
+    if workers <= 1:
+        _initialize()
+        yield from map(_parse, entries)
+        return
+
+    with Pool(workers, initializer=_initialize) as pool:
+        mapping = pool.imap if ordered else pool.imap_unordered
+        yield from mapping(_parse, entries, chunksize)
@@ -0,0 +1,115 @@
+from array import array
+from re import compile as _compile, IGNORECASE
+from sqlton.number import numeric
+from sqlton.pool import ParserPool
+from sqlton.ast import Insert, Replace, ColumnarValues
+
+pool = ParserPool()
+
+scanner = _compile(r'\s*(?:'
+                   r'(?P<sign>[+-]?)\s*(?P<number>0[xX][\dA-Fa-f]+|(\d+(\.\d+)?|\.\d+)((e|E)[+-]?\d+)?)(?![\w.])'
+                   r"|(?P<string>'[^']*'|\"[^\"]*\")"
+                   r'|(?P<word>TRUE|FALSE|NULL)(?!\w)'
+                   r')\s*(?P<separator>[,)])', IGNORECASE)
+
+opening = _compile(r'\s*\(')
+
+following = _compile(r'\s*,')
+
+words = {'TRUE': True, 'FALSE': False, 'NULL': None}
+
+codes = {int: 'q', float: 'd'}
+
+
+def header(lexer, statement):
+    depth = 0
+
+    for token in lexer.tokenize(statement):
+        if token.type == 'LP':
+            depth += 1
+        elif token.type == 'RP':
+            depth -= 1
+        elif token.type == 'VALUES' and depth == 0:
+            return token.index + len(token.value)
+        elif token.type in ('SELECT', 'DEFAULT', 'SEMICOLON') and depth == 0:
+            return None
+
+    return None
+
+
+def rows(statement, position):
+    columns = None
+    first = None
+
+    while True:
+        start = opening.match(statement, position)
+        if start is None:
+            return None
+
+        position = start.end()
+        row = []
+
+        while True:
+            value = scanner.match(statement, position)
+            if value is None:
+                return None
+
+            position = value.end()
+
+            if value['number'] is not None:
+                number = numeric(value['number'])
+                row.append(-number if value['sign'] == '-' else number)
+            elif value['string'] is not None:
+                row.append(value['string'][1:-1])
+            else:
+                row.append(words[value['word'].upper()])
+
+            if value['separator'] == ')':
+                break
+
+        if columns is None:
+            first = (start.start(), position)
+            columns = [[] for _ in row]
+        elif len(row) != len(columns):
+            return None
+
+        for column, entry in zip(columns, row):
+            column.append(entry)
+
+        separator = following.match(statement, position)
+        if separator is None:
+            return columns, first, position
+
+        position = separator.end()
+
+
+def compact(column):
+    kinds = set(map(type, column))
+
+    if len(kinds) == 1:
+        code = codes.get(kinds.pop())
+        if code is not None:
+            try:
+                return array(code, column)
+            except OverflowError:
+                pass
+
+    return column
+
+
+def parse_insert(statement):
+    with pool.acquire() as (lexer, parser):
+        position = header(lexer, statement)
+        scanned = None if position is None else rows(statement, position)
+
+        if scanned is None:
+            return parser.parse(lexer.tokenize(statement))
+
+        columns, (begin, end), position = scanned
+        statements = parser.parse(lexer.tokenize(statement[:end] + statement[position:]))
+
+    if not statements or not isinstance(statements[0], (Insert, Replace)):
+        return statements
+
+    statements[0].values = ColumnarValues(tuple(map(compact, columns)))
+    return statements
@@ -0,0 +1,104 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from sqlton.pool import ParserPool
+from sqlton.ast import substitute
+from sqlton.errors import SqltonSyntaxError
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'evictions', 'maxsize', 'currsize'))
+
+LITERALS = frozenset(('NUMERIC_LITERAL', 'STRING_LITERAL'))
+VALUED = frozenset(('IDENTIFIER', 'PARAMETER', 'BOOLEAN_LITERAL', 'DIFFERENCE', 'ERROR'))
+
+
+class Slot:
+    __slots__ = ('index', 'negated')
+
+    def __init__(self, index, negated=False):
+        self.index = index
+        self.negated = negated
+
+    def __neg__(self):
+        return Slot(self.index, not self.negated)
+
+    def __repr__(self):
+        return f'Slot({self.index}, negated={self.negated})' if self.negated else f'Slot({self.index})'
+
+    def value(self, values):
+        return -values[self.index] if self.negated else values[self.index]
+
+
+class ParseCache:
+    def __init__(self, maxsize=1024, on_error='print', intern=False):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+        self.__pool = ParserPool(on_error='raise', intern=intern)
+        self.__fallback = ParserPool(on_error=on_error, intern=intern)
+
+    def parse(self, statement):
+        try:
+            with self.__pool.acquire() as (lexer, _):
+                tokens = list(lexer.tokenize(statement))
+        except SqltonSyntaxError:
+            return self.__fallback.parse(statement)
+
+        values = []
+        key = []
+
+        for token in tokens:
+            if token.type in LITERALS:
+                key.append(token.type)
+                values.append(token.value)
+            elif token.type in VALUED:
+                key.append((token.type, token.value))
+            else:
+                key.append(token.type)
+
+        key = tuple(key)
+
+        with self.__lock:
+            template = self.__entries.get(key)
+            if template is not None:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if template is None:
+            try:
+                template = self.__template(tokens)
+            except SqltonSyntaxError:
+                return self.__fallback.parse(statement)
+            self.__store(key, template)
+
+        return substitute(template, Slot, lambda slot: slot.value(values))
+
+    def __template(self, tokens):
+        index = 0
+        for token in tokens:
+            if token.type in LITERALS:
+                token.value = Slot(index)
+                index += 1
+
+        with self.__pool.acquire() as (_, parser):
+            return parser.parse(iter(tokens))
+
+    def __store(self, key, template):
+        with self.__lock:
+            self.__entries[key] = template
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self.maxsize, len(self.__entries))
+
+    def cache_clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = self.misses = self.evictions = 0
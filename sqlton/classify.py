@@ -0,0 +1,106 @@
+from re import compile as _compile, escape
+from sqlton.ast import Select, Insert, Replace, Update, Delete, Create, Drop
+from sqlton.errors import SqltonSyntaxError
+from sqlton.parser import Lexer
+
+kinds = {'SELECT': Select,
+         'VALUES': Select,
+         'INSERT': Insert,
+         'REPLACE': Replace,
+         'UPDATE': Update,
+         'DELETE': Delete,
+         'CREATE': Create,
+         'DROP': Drop}
+
+master = Lexer._master_re.match
+blank = _compile(f'[{escape(Lexer.ignore)}]*').match
+skip = _compile(r'[^;()\'"`]*').match
+ignored = frozenset(Lexer._ignored_tokens)
+quotes = frozenset('\'"`')
+spaces = frozenset(' \t\r\n')
+
+
+def illegal(sql, index):
+    return SqltonSyntaxError(f'illegal character {sql[index]!r}',
+                             index, sql.count('\n', 0, index) + 1, 'ERROR', sql[index])
+
+
+def trim(sql, start, stop):
+    while sql[stop - 1] in spaces:
+        stop -= 1
+
+    return start, stop
+
+
+def statements(sql):
+    index = 0
+    length = len(sql)
+    depth = 0
+    kind = start = None
+
+    while True:
+        if kind is None and depth == 0:
+            index = blank(sql, index).end()
+
+            if index >= length:
+                break
+
+            match = master(sql, index)
+
+            if match is None:
+                raise illegal(sql, index)
+
+            group = match.lastgroup
+
+            if group == 'IDENTIFIER':
+                kind = kinds.get(match.group().upper())
+            elif group == 'LP':
+                depth += 1
+            elif group == 'SEMICOLON':
+                if start is not None:
+                    yield (kind, *trim(sql, start, index))
+                start = None
+                index += 1
+                continue
+
+            if start is None and group not in ignored:
+                start = index
+
+            index = match.end()
+            continue
+
+        index = skip(sql, index).end()
+
+        if index >= length:
+            break
+
+        character = sql[index]
+
+        if character == ';':
+            yield (kind, *trim(sql, start, index))
+            kind = start = None
+            depth = 0
+        elif character in quotes:
+            closing = sql.find(character, index + 1)
+
+            if closing < 0:
+                raise illegal(sql, index)
+
+            index = closing
+        elif character == '(':
+            depth += 1
+        else:
+            depth -= 1
+
+        index += 1
+
+    if start is not None:
+        yield (kind, *trim(sql, start, length))
+
+
+def classify(sql):
+    return tuple(kind for kind, _, _ in statements(sql))
+
+
+def split(sql):
+    return tuple(sql[start:end] for _, start, end in statements(sql))
@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from sqlton.errors import SqltonSyntaxError
+from sqlton.parser import Lexer, Parser
+from sqlton.stream import split_statements
+
+BLANK = object()
+
+
+class Document:
+    def __init__(self, text='', history=256):
+        self.text = text
+        self.history = history
+        self.__recent = OrderedDict()
+        self.__lexer = Lexer()
+        self.__parser = Parser(on_error='raise')
+        self.__spans = []
+        self.__trees = []
+        self.__replace(0, 0, self.__split(0, {})[0], {})
+
+    @property
+    def statements(self):
+        return tuple(tree for tree in self.__trees if tree is not BLANK)
+
+    @property
+    def spans(self):
+        return tuple(span for span, tree in zip(self.__spans, self.__trees) if tree is not BLANK)
+
+    def apply_edit(self, range, text):
+        start, end = range
+
+        if not 0 <= start <= end <= len(self.text):
+            raise IndexError(f'edit range {range!r} outside of document')
+
+        source = self.text
+        delta = len(text) - (end - start)
+        self.text = source[:start] + text + source[end:]
+
+        first = 0
+        while first < len(self.__spans) and self.__spans[first][1] < start:
+            first += 1
+
+        if first < len(self.__spans):
+            offset = self.__spans[first][0]
+        else:
+            offset = self.__spans[-1][1] + 1 if self.__spans else 0
+
+        following = {span_start + delta: index
+                     for index, (span_start, _) in enumerate(self.__spans[first + 1:], first + 1)
+                     if span_start >= end}
+
+        pieces, last = self.__split(offset, following)
+
+        reusable = {source[span_start:span_end]: tree
+                    for (span_start, span_end), tree in zip(self.__spans[first:last],
+                                                            self.__trees[first:last])
+                    if tree is not None}
+
+        self.__spans[last:] = [(span_start + delta, span_end + delta)
+                               for span_start, span_end in self.__spans[last:]]
+
+        before = self.statements
+        self.__replace(first, last, pieces, reusable)
+
+        return [index for index, tree in enumerate(self.statements)
+                if index >= len(before) or tree is not before[index]]
+
+    def __split(self, offset, following):
+        pieces = []
+        position = offset
+
+        for piece in split_statements((self.text[offset:],)):
+            pieces.append((position, position + len(piece)))
+            position += len(piece) + 1
+
+            if position in following:
+                return pieces, following[position]
+
+        return pieces, len(self.__spans)
+
+    def __replace(self, first, last, pieces, reusable):
+        trees = []
+
+        for start, end in pieces:
+            source = self.text[start:end]
+
+            if not source.strip():
+                trees.append(BLANK)
+            elif source in reusable:
+                trees.append(reusable.pop(source))
+            elif source in self.__recent:
+                trees.append(self.__recent.pop(source))
+            else:
+                trees.append(self.__parse(source, start))
+
+        self.__spans[first:last] = pieces
+        self.__trees[first:last] = trees
+
+        self.__recent.update(reusable)
+        while len(self.__recent) > self.history:
+            self.__recent.popitem(last=False)
+
+    def __parse(self, source, start):
+        try:
+            statements = self.__parser.parse(self.__lexer.tokenize(source,
+                                                                   lineno=self.text.count('\n', 0, start) + 1))
+        except SqltonSyntaxError:
+            return None
+
+        return statements[0] if statements else None
@@ -0,0 +1,19 @@
+class SqltonSyntaxError(ValueError):
+    def __init__(self, message, index=None, lineno=None, token=None, value=None, expected=()):
+        super().__init__(message)
+        self.message = message
+        self.index = index
+        self.lineno = lineno
+        self.token = token
+        self.value = value
+        self.expected = expected
+
+    def __reduce__(self):
+        return (type(self), (self.message, self.index, self.lineno,
+                             self.token, self.value, self.expected))
+
+    def __str__(self):
+        if self.lineno is None:
+            return self.message
+
+        return f'{self.message} at line {self.lineno}, index {self.index}'
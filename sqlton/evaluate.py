@@ -0,0 +1,655 @@
+import operator
+from collections import namedtuple, OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from re import compile as _compile, escape, IGNORECASE, DOTALL
+from threading import Lock
+from sqlton.ast import Operation, Column, Parameter
+from sqlton.number import Number, numeric
+from sqlton.visit import walk
+
+Constant = namedtuple('Constant', ('value',))
+
+_cache = OrderedDict()
+_identities = OrderedDict()
+_lock = Lock()
+
+maxsize = 1024
+
+ranks = {bool: 1, int: 1, float: 1, str: 2, bytes: 3}
+
+plain = frozenset((bool, int, float))
+
+leading = _compile(r'\s*[+-]?((\d+(\.\d*)?)|(\.\d+))([eE][+-]?\d+)?')
+
+comparisons = {'=': operator.eq,
+               '==': operator.eq,
+               '!=': operator.ne,
+               '<>': operator.ne,
+               '<': operator.lt,
+               '<=': operator.le,
+               '>': operator.gt,
+               '>=': operator.ge}
+
+collations = {'BINARY': None,
+              'NOCASE': str.lower,
+              'RTRIM': str.rstrip}
+
+
+def text(value):
+    if isinstance(value, bool):
+        value = int(value)
+
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def number(value):
+    if type(value) in plain:
+        return value
+
+    match = leading.match(text(value))
+    return 0 if match is None else numeric(match.group().strip())
+
+
+def length(value):
+    return len(value) if isinstance(value, bytes) else len(text(value))
+
+
+def textual(method):
+    def apply(value, *arguments):
+        return method(text(value), *map(text, arguments))
+
+    return apply
+
+
+def rounding(value, digits=0):
+    return round(number(value), int(number(digits)))
+
+
+def coalesce(*arguments):
+    return next((argument for argument in arguments if argument is not None), None)
+
+
+functions = {'ABS': lambda value: abs(number(value)),
+             'LOWER': textual(str.lower),
+             'UPPER': textual(str.upper),
+             'LENGTH': length,
+             'TRIM': textual(str.strip),
+             'LTRIM': textual(str.lstrip),
+             'RTRIM': textual(str.rstrip),
+             'ROUND': rounding,
+             'COALESCE': coalesce,
+             'IFNULL': coalesce}
+
+tolerant = {'COALESCE', 'IFNULL'}
+
+
+def divide(a, b):
+    if b == 0:
+        return None
+
+    if isinstance(a, int) and isinstance(b, int):
+        quotient = abs(a) // abs(b)
+        return quotient if (a < 0) == (b < 0) else -quotient
+
+    return a / b
+
+
+def coerced(apply):
+    def wrapper(a, b):
+        if type(a) in plain and type(b) in plain:
+            return apply(a, b)
+
+        return apply(number(a), number(b))
+
+    return wrapper
+
+
+def negative(value):
+    return -number(value)
+
+
+arithmetic = {'+': coerced(operator.add),
+              '-': coerced(operator.sub),
+              '*': coerced(operator.mul),
+              '/': coerced(divide)}
+
+
+def ordered(compare, a, b):
+    return compare(ranks.get(type(a), 0), ranks.get(type(b), 0))
+
+
+def translate_like(pattern):
+    return _compile(''.join('.*' if character == '%'
+                            else '.' if character == '_'
+                            else escape(character)
+                            for character in pattern),
+                    IGNORECASE | DOTALL)
+
+
+def inverted(pattern, position):
+    return pattern[position + 1:position + 2] == '^'
+
+
+def translate_glob(pattern):
+    parts = []
+    position = 0
+
+    while position < len(pattern):
+        character = pattern[position]
+
+        if character == '*':
+            parts.append('.*')
+        elif character == '?':
+            parts.append('.')
+        elif character == '[' and (end := pattern.find(']', position + 2 + inverted(pattern, position))) > 0:
+            start = position + 1 + inverted(pattern, position)
+            body = ''.join('\\' + member if member in '\\[]^' else member
+                           for member in pattern[start:end])
+            parts.append('[' + '^' * inverted(pattern, position) + body + ']')
+            position = end
+        else:
+            parts.append(escape(character))
+
+        position += 1
+
+    return _compile(''.join(parts), DOTALL)
+
+
+def translate_regexp(pattern):
+    return _compile(pattern)
+
+
+matchers = {'LIKE': (lru_cache(maxsize=256)(translate_like), 'fullmatch'),
+            'GLOB': (lru_cache(maxsize=256)(translate_glob), 'fullmatch'),
+            'REGEXP': (lru_cache(maxsize=256)(translate_regexp), 'search')}
+
+
+def to_int(value):
+    try:
+        return int(number(value))
+    except (ValueError, OverflowError):
+        return 0
+
+
+def to_float(value):
+    return float(number(value))
+
+
+def to_numeric(value):
+    value = number(value)
+    return int(value) if isinstance(value, float) and value.is_integer() and abs(value) < 1 << 63 else value
+
+
+casts = {int: to_int,
+         float: to_float,
+         Number: to_numeric,
+         str: text}
+
+
+def constant(node):
+    return isinstance(node, Constant)
+
+
+def function(node):
+    if constant(node):
+        value = node.value
+        return lambda row: value
+
+    return node
+
+
+def unary(apply, a):
+    if constant(a):
+        return Constant(None if a.value is None else apply(a.value))
+
+    def evaluate(row):
+        value = a(row)
+        return None if value is None else apply(value)
+
+    return evaluate
+
+
+def binary(apply, a, b):
+    if constant(a) and constant(b):
+        return Constant(None
+                        if a.value is None or b.value is None
+                        else apply(a.value, b.value))
+
+    if constant(b):
+        right = b.value
+
+        if right is None:
+            return Constant(None)
+
+        def evaluate(row):
+            left = a(row)
+            return None if left is None else apply(left, right)
+
+        return evaluate
+
+    if constant(a):
+        left = a.value
+
+        if left is None:
+            return Constant(None)
+
+        def evaluate(row):
+            right = b(row)
+            return None if right is None else apply(left, right)
+
+        return evaluate
+
+    def evaluate(row):
+        left = a(row)
+        if left is None:
+            return None
+        right = b(row)
+        return None if right is None else apply(left, right)
+
+    return evaluate
+
+
+def compare(name):
+    comparison = comparisons[name]
+
+    def apply(a, b):
+        try:
+            return comparison(a, b)
+        except TypeError:
+            return ordered(comparison, a, b)
+
+    return apply
+
+
+def comparing(name, a, b):
+    comparison = comparisons[name]
+
+    if constant(a) or not constant(b) or b.value is None:
+        return binary(compare(name), a, b)
+
+    right = b.value
+
+    def evaluate(row):
+        left = a(row)
+        if left is None:
+            return None
+        try:
+            return comparison(left, right)
+        except TypeError:
+            return ordered(comparison, left, right)
+
+    return evaluate
+
+
+def collation(node):
+    if isinstance(node, Operation) and node.operator == ('COLLATE',):
+        name = node.b.upper()
+
+        if name not in collations:
+            raise ValueError(f'unknown collation {node.b!r}')
+
+        return collations[name]
+
+    return None
+
+
+def collated(apply, collate):
+    def wrapper(a, b):
+        if isinstance(a, str) and isinstance(b, str):
+            return apply(collate(a), collate(b))
+        return apply(a, b)
+
+    return wrapper
+
+
+def operands(expression, name):
+    stack = [expression]
+    found = []
+
+    while stack:
+        node = stack.pop()
+
+        if isinstance(node, Operation) and node.operator == (name,):
+            stack.append(node.b)
+            stack.append(node.a)
+        else:
+            found.append(node)
+
+    return found
+
+
+def conjunction(terms):
+    values = [term.value for term in terms if constant(term)]
+
+    if any(value is not None and not value for value in values):
+        return Constant(False)
+
+    unknown = None in values
+    terms = [term for term in terms if not constant(term)]
+
+    if not terms:
+        return Constant(None if unknown else True)
+
+    def evaluate(row):
+        missing = unknown
+        for term in terms:
+            value = term(row)
+            if value is None:
+                missing = True
+            elif not value:
+                return False
+        return None if missing else True
+
+    return evaluate
+
+
+def disjunction(terms):
+    values = [term.value for term in terms if constant(term)]
+
+    if any(values):
+        return Constant(True)
+
+    unknown = None in values
+    terms = [term for term in terms if not constant(term)]
+
+    if not terms:
+        return Constant(None if unknown else False)
+
+    def evaluate(row):
+        missing = unknown
+        for term in terms:
+            value = term(row)
+            if value:
+                return True
+            if value is None:
+                missing = True
+        return None if missing else False
+
+    return evaluate
+
+
+def calculation(first, links):
+    if constant(first) and all(constant(b) for _, b in links):
+        value = first.value
+        for apply, b in links:
+            value = None if value is None or b.value is None else apply(value, b.value)
+        return Constant(value)
+
+    if len(links) == 1:
+        (apply, b), = links
+        return binary(apply, first, b)
+
+    first = function(first)
+    links = [(apply, function(b)) for apply, b in links]
+
+    def evaluate(row):
+        value = first(row)
+        for apply, b in links:
+            if value is None:
+                return None
+            right = b(row)
+            if right is None:
+                return None
+            value = apply(value, right)
+        return value
+
+    return evaluate
+
+
+def membership(a, values, negated):
+    if not all(map(constant, values)):
+        a, values = function(a), [function(value) for value in values]
+
+        def evaluate(row):
+            left = a(row)
+            if left is None:
+                return None
+            unknown = False
+            for value in values:
+                right = value(row)
+                if right is None:
+                    unknown = True
+                elif left == right:
+                    return not negated
+            return None if unknown else negated
+
+        return evaluate
+
+    unknown = any(value.value is None for value in values)
+    values = [value.value for value in values if value.value is not None]
+
+    try:
+        values = frozenset(values)
+    except TypeError:
+        pass
+
+    if not values and not unknown:
+        return Constant(negated)
+
+    if constant(a):
+        return Constant(None if a.value is None
+                        else not negated if a.value in values
+                        else None if unknown else negated)
+
+    def evaluate(row):
+        left = a(row)
+        if left is None:
+            return None
+        if left in values:
+            return not negated
+        return None if unknown else negated
+
+    return evaluate
+
+
+def matching(name, a, b):
+    translate, method = matchers[name]
+
+    if constant(b) and b.value is not None:
+        test = getattr(translate(text(b.value)), method)
+        return unary(lambda value: test(text(value)) is not None, a)
+
+    return binary(lambda value, pattern: getattr(translate(text(pattern)), method)(text(value)) is not None,
+                  a, b)
+
+
+def call(name, parameters):
+    key = name.upper()
+
+    if key not in functions or parameters.get('distinct') or parameters.get('filter') is not None:
+        raise ValueError(f'cannot compile call to {name!r}')
+
+    apply = functions[key]
+    arguments = [build(argument) for argument in parameters['arguments']]
+
+    if all(map(constant, arguments)):
+        values = [argument.value for argument in arguments]
+        if key in tolerant or None not in values:
+            return Constant(apply(*values))
+        return Constant(None)
+
+    arguments = [function(argument) for argument in arguments]
+
+    if key in tolerant:
+        return lambda row: apply(*[argument(row) for argument in arguments])
+
+    if len(arguments) == 1:
+        return unary(apply, arguments[0])
+
+    def evaluate(row):
+        values = [argument(row) for argument in arguments]
+        return None if None in values else apply(*values)
+
+    return evaluate
+
+
+def column(node):
+    if node.table is None:
+        return itemgetter(node.name)
+
+    name = node.name
+    qualified = f'{node.table.name}.{name}'
+
+    def evaluate(row):
+        try:
+            return row[qualified]
+        except KeyError:
+            return row[name]
+
+    return evaluate
+
+
+def build(node):
+    if isinstance(node, Column):
+        return column(node)
+
+    if isinstance(node, Parameter):
+        raise ValueError(f'unbound parameter {node.name!r}, bind it before compiling')
+
+    if isinstance(node, Number):
+        return Constant(node.value)
+
+    if not isinstance(node, Operation):
+        if node is None or isinstance(node, (bool, int, float, str, bytes)):
+            return Constant(node)
+
+        raise ValueError(f'cannot compile {type(node).__name__}')
+
+    name = node.operator[-1]
+    negated = node.operator[0] == 'NOT' and len(node.operator) > 1
+
+    if name in comparisons:
+        collate = collation(node.a) or collation(node.b)
+
+        if collate is not None:
+            return binary(collated(compare(name), collate), build(node.a), build(node.b))
+
+        return comparing(name, build(node.a), build(node.b))
+
+    if name == 'AND':
+        return conjunction([build(term) for term in operands(node, 'AND')])
+
+    if name == 'OR':
+        return disjunction([build(term) for term in operands(node, 'OR')])
+
+    if node.operator == ('NOT',):
+        return unary(operator.not_, build(node.b))
+
+    if node.operator == ('MINUS',):
+        return unary(negative, build(node.b))
+
+    if name in arithmetic:
+        links = []
+
+        while isinstance(node, Operation) and node.a is not None and node.operator[-1] in arithmetic:
+            links.append((arithmetic[node.operator[-1]], build(node.b)))
+            node = node.a
+
+        links.reverse()
+        return calculation(build(node), links)
+
+    if node.operator in (('IS',), ('IS', 'NOT')):
+        a = build(node.a)
+
+        if constant(a):
+            return Constant((a.value is None) != (name == 'NOT'))
+
+        if name == 'NOT':
+            return lambda row: a(row) is not None
+
+        return lambda row: a(row) is None
+
+    if name == 'IN':
+        if type(node.b) is not tuple:
+            raise ValueError('cannot compile subquery')
+
+        return membership(build(node.a), [build(value) for value in node.b], negated)
+
+    if name in matchers:
+        matcher = matching(name, build(node.a), build(node.b))
+
+        if negated:
+            return unary(operator.not_, matcher)
+
+        return matcher
+
+    if name == 'COLLATE':
+        collation(node)
+        return build(node.a)
+
+    if name == 'CAST':
+        a = build(node.a)
+
+        if node.b is None:
+            return Constant(None)
+
+        return unary(casts[node.b], a)
+
+    if name == 'CALL':
+        return call(node.a, node.b)
+
+    raise ValueError(f"cannot compile operator {' '.join(node.operator)}")
+
+
+def shape(expression):
+    key = []
+
+    for node in walk(expression):
+        if isinstance(node, tuple):
+            key.append((type(node), len(node)))
+        elif isinstance(node, dict):
+            key.append((dict, tuple(node)))
+        elif hasattr(node, '_asdict'):
+            key.append((type(node), tuple(node._asdict())))
+        elif isinstance(node, Number):
+            key.append((Number, node.text))
+        else:
+            key.append((type(node), node))
+
+    return tuple(key)
+
+
+def remember(entries, key, value):
+    entries[key] = value
+
+    while len(entries) > maxsize:
+        entries.popitem(last=False)
+
+
+def cached(kind, expression, factory):
+    identity = (kind, id(expression))
+
+    with _lock:
+        entry = _identities.get(identity)
+        if entry is not None and entry[0] is expression:
+            _identities.move_to_end(identity)
+            return entry[1]
+
+    key = (kind, shape(expression))
+
+    with _lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+
+    if compiled is None:
+        compiled = factory()
+
+    with _lock:
+        remember(_cache, key, compiled)
+        remember(_identities, identity, (expression, compiled))
+
+    return compiled
+
+
+def evaluator(expression):
+    return cached('value', expression, lambda: function(build(expression)))
+
+
+def predicate(expression):
+    def factory():
+        evaluate = evaluator(expression)
+        return lambda row: bool(evaluate(row))
+
+    return cached('predicate', expression, factory)
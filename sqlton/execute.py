@@ -0,0 +1,695 @@
+import operator
+from collections import ChainMap
+from collections.abc import Mapping
+from csv import DictReader
+from functools import partial
+from heapq import nsmallest
+from itertools import chain, islice
+from re import compile as _compile
+from sys import modules
+from sqlton.ast import Select, SelectCore, Operation, Table, Column, All, Alias
+from sqlton.evaluate import evaluator, predicate, ordered, ranks, operands, shape
+from sqlton.number import numeric
+from sqlton.pool import ParserPool
+from sqlton.unparse import unparse
+from sqlton.visit import walk, rewrite, PRUNE
+from sqlton.vectorize import mask
+
+_pool = ParserPool(on_error='raise')
+
+number = _compile(r'[+-]?((\d+(\.\d*)?)|(\.\d+))([eE][+-]?\d+)?')
+
+
+class Row(dict):
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return None
+
+
+class Count:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def add(self, value):
+        if value is not None:
+            self.value += 1
+
+    def result(self):
+        return self.value
+
+
+class Sum:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = None
+
+    def add(self, value):
+        if value is not None:
+            self.value = value if self.value is None else self.value + value
+
+    def result(self):
+        return self.value
+
+
+class Total(Sum):
+    __slots__ = ()
+
+    def result(self):
+        return 0.0 if self.value is None else float(self.value)
+
+
+class Average:
+    __slots__ = ('total', 'count')
+
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+
+    def add(self, value):
+        if value is not None:
+            self.total += value
+            self.count += 1
+
+    def result(self):
+        return self.total / self.count if self.count else None
+
+
+class Extremum:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = None
+
+    def add(self, value):
+        if value is not None and (self.value is None or self.better(value, self.value)):
+            self.value = value
+
+    def result(self):
+        return self.value
+
+
+class Minimum(Extremum):
+    __slots__ = ()
+
+    def better(self, value, current):
+        try:
+            return value < current
+        except TypeError:
+            return ordered(operator.lt, value, current)
+
+
+class Maximum(Extremum):
+    __slots__ = ()
+
+    def better(self, value, current):
+        try:
+            return value > current
+        except TypeError:
+            return ordered(operator.gt, value, current)
+
+
+class Concatenation:
+    __slots__ = ('values', 'separator')
+
+    def __init__(self, separator=','):
+        self.values = []
+        self.separator = separator
+
+    def add(self, value):
+        if value is not None:
+            self.values.append(str(value))
+
+    def result(self):
+        return self.separator.join(self.values) if self.values else None
+
+
+class Distinct:
+    __slots__ = ('seen', 'accumulator')
+
+    def __init__(self, accumulator):
+        self.seen = set()
+        self.accumulator = accumulator()
+
+    def add(self, value):
+        if value not in self.seen:
+            self.seen.add(value)
+            self.accumulator.add(value)
+
+    def result(self):
+        return self.accumulator.result()
+
+
+aggregates = {'COUNT': Count,
+              'SUM': Sum,
+              'TOTAL': Total,
+              'AVG': Average,
+              'MIN': Minimum,
+              'MAX': Maximum,
+              'GROUP_CONCAT': Concatenation}
+
+
+def convert(value):
+    if value == '':
+        return None
+
+    if number.fullmatch(value):
+        return numeric(value.lstrip('+'))
+
+    return value
+
+
+def read_csv(path, types=None, encoding='utf-8', **options):
+    def rows():
+        with open(path, newline='', encoding=encoding) as file:
+            for row in DictReader(file, **options):
+                yield {key: (types[key] if types is not None and key in types else convert)(value)
+                       for key, value in row.items()}
+
+    return rows
+
+
+def columnar(item):
+    numpy = modules.get('numpy')
+
+    return (numpy is not None
+            and isinstance(item, Mapping)
+            and any(isinstance(value, numpy.ndarray) for value in item.values()))
+
+
+def unpack(batch, where):
+    if where is not None:
+        try:
+            selected = mask(where, batch)
+        except (ValueError, TypeError):
+            selected = None
+        else:
+            where = None
+
+        if selected is not None:
+            batch = {name: column[selected] for name, column in batch.items()}
+
+    names = list(batch)
+    rows = (dict(zip(names, values))
+            for values in zip(*(column.tolist() if hasattr(column, 'tolist') else column
+                                for column in batch.values())))
+
+    return rows if where is None else filter(predicate(where), rows)
+
+
+def scan(source, where=None):
+    if callable(source):
+        source = source()
+
+    if isinstance(source, Mapping):
+        source = (source,)
+
+    iterator = iter(source)
+    first = next(iterator, None)
+
+    if first is None:
+        return
+
+    iterator = chain((first,), iterator)
+
+    if columnar(first):
+        for batch in iterator:
+            yield from unpack(batch, where)
+    elif where is None:
+        yield from iterator
+    else:
+        yield from filter(predicate(where), iterator)
+
+
+def qualify(rows, alias):
+    for row in rows:
+        qualified = dict(row)
+        qualified.update((f'{alias}.{key}', value) for key, value in row.items())
+        yield qualified
+
+
+def name_of(node):
+    if isinstance(node, Alias):
+        return node.replacement
+
+    if isinstance(node, Table):
+        return node.name
+
+    return None
+
+
+def aliases(node):
+    if isinstance(node, Operation):
+        return aliases(node.a) | aliases(node.b)
+
+    return {name_of(node)}
+
+
+def source_of(node, sources):
+    original = node.original if isinstance(node, Alias) else node
+
+    if isinstance(original, Table):
+        for key in (f'{original.schema_name}.{original.name}', original.name):
+            if key in sources:
+                return sources[key]
+
+        raise KeyError(f'no source for table {original.name!r}')
+
+    if isinstance(original, Select):
+        return partial(execute, original, sources)
+
+    raise ValueError(f'cannot execute from {type(original).__name__}')
+
+
+def conjuncts(expression):
+    return operands(expression, 'AND')
+
+
+def owner(node, left, right):
+    tables = {column.table.name if column.table is not None else None
+              for column in walk(node) if isinstance(column, Column)}
+
+    if not tables or None in tables:
+        return None
+
+    if tables <= left:
+        return 'left'
+
+    if tables <= right:
+        return 'right'
+
+    return None
+
+
+def equalities(condition, left, right):
+    keys = []
+    residual = []
+
+    for term in conjuncts(condition) if condition is not None else ():
+        if isinstance(term, Operation) and term.operator in (('=',), ('==',)):
+            sides = owner(term.a, left, right), owner(term.b, left, right)
+
+            if sides == ('left', 'right'):
+                keys.append((term.a, term.b))
+                continue
+
+            if sides == ('right', 'left'):
+                keys.append((term.b, term.a))
+                continue
+
+        residual.append(term)
+
+    return keys, residual
+
+
+def hash_join(left_rows, right_rows, keys, residual, outer):
+    left_keys = [evaluator(left) for left, _ in keys]
+    right_keys = [evaluator(right) for _, right in keys]
+    test = None if residual is None else predicate(residual)
+    table = {}
+    padding = set()
+
+    for row in right_rows:
+        if outer:
+            padding.update(row)
+
+        key = tuple(evaluate(row) for evaluate in right_keys)
+
+        if None not in key:
+            table.setdefault(key, []).append(row)
+
+    padding = dict.fromkeys(padding)
+
+    for row in left_rows:
+        key = tuple(evaluate(row) for evaluate in left_keys)
+        matched = False
+
+        for other in table.get(key, ()) if None not in key else ():
+            merged = {**row, **other}
+
+            if test is None or test(merged):
+                matched = True
+                yield merged
+
+        if outer and not matched:
+            yield Row({**padding, **row})
+
+
+def join(node, sources, where):
+    if not isinstance(node, Operation):
+        alias = name_of(node)
+        local = [term for term in conjuncts(where) if owner(term, {alias}, set()) == 'left'] \
+            if where is not None else []
+        return qualify(scan(source_of(node, sources), conjunction(local)), alias)
+
+    modifiers = set(node.operator[1:-1])
+    constraint = node.operator[-1]
+
+    if modifiers & {'RIGHT', 'FULL', 'NATURAL'}:
+        raise ValueError(f"cannot execute {' '.join(sorted(modifiers))} JOIN")
+
+    left, right = aliases(node.a), aliases(node.b)
+
+    if constraint is not None and constraint[0] == 'USING':
+        keys = [(Column(name), Column(name)) for name in constraint[1]]
+        residual = []
+    else:
+        keys, residual = equalities(constraint[1] if constraint is not None else None, left, right)
+
+    if 'LEFT' not in modifiers and where is not None:
+        keys += equalities(where, left, right)[0]
+
+    return hash_join(join(node.a, sources, where),
+                     join(node.b, sources, None if 'LEFT' in modifiers else where),
+                     keys,
+                     conjunction(residual),
+                     'LEFT' in modifiers)
+
+
+def conjunction(terms):
+    if not terms:
+        return None
+
+    expression = terms[0]
+
+    for term in terms[1:]:
+        expression = Operation(('AND',), expression, term)
+
+    return expression
+
+
+def tables(core, sources):
+    table_list = getattr(core, 'table_list', None) or ()
+    where = getattr(core, 'where', None)
+
+    if not table_list:
+        return (Row(),) if where is None else filter(predicate(where), (Row(),))
+
+    if len(table_list) == 1 and not isinstance(table_list[0], Operation):
+        return scan(source_of(table_list[0], sources), where)
+
+    node = table_list[0]
+    for item in table_list[1:]:
+        node = Operation(('JOIN', None), node, item)
+
+    rows = join(node, sources, where)
+    return rows if where is None else filter(predicate(where), rows)
+
+
+def aggregated(node):
+    return (isinstance(node, Operation)
+            and node.operator == ('CALL',)
+            and node.a.upper() in aggregates)
+
+
+def accumulator(call):
+    parameters = call.b
+    kind = aggregates[call.a.upper()]
+    arguments = parameters['arguments']
+
+    if isinstance(arguments, All):
+        evaluate = lambda row: 1
+    else:
+        evaluate = evaluator(arguments[0])
+
+        if kind is Concatenation and len(arguments) > 1:
+            kind = partial(Concatenation, evaluator(arguments[1])(Row()))
+
+        if parameters.get('distinct'):
+            kind = partial(Distinct, kind)
+
+    condition = parameters.get('filter')
+
+    if condition is not None:
+        test = predicate(condition)
+        return (lambda row: evaluate(row) if test(row) else None), kind
+
+    return evaluate, kind
+
+
+def group(rows, core, expressions):
+    calls = {}
+
+    def enter(node):
+        if aggregated(node):
+            key = shape(node)
+            if key not in calls:
+                calls[key] = (Column(f'#{len(calls)}'), node)
+            return calls[key][0]
+        if isinstance(node, Select):
+            return PRUNE
+        return node
+
+    expressions = [rewrite(expression, enter) for expression in expressions]
+    grouping = [evaluator(expression) for expression in getattr(core, 'group', None) or ()]
+
+    if not calls and not grouping:
+        return rows, expressions
+
+    states = [accumulator(call) for _, call in calls.values()]
+    names = [placeholder.name for placeholder, _ in calls.values()]
+    groups = {}
+
+    for row in rows:
+        key = tuple(evaluate(row) for evaluate in grouping)
+        state = groups.get(key)
+
+        if state is None:
+            state = groups[key] = (row, [kind() for _, kind in states])
+
+        for (evaluate, _), accumulated in zip(states, state[1]):
+            accumulated.add(evaluate(row))
+
+    if not groups and not grouping:
+        groups[()] = (Row(), [kind() for _, kind in states])
+
+    return ((ChainMap(dict(zip(names, (accumulated.result() for accumulated in state))), first)
+             for first, state in groups.values()),
+            expressions)
+
+
+def expand(node, row, qualified):
+    if isinstance(row, ChainMap):
+        row = row.maps[-1]
+
+    if node.table is not None:
+        prefix = f'{node.table.name}.'
+        return {key[len(prefix):]: value for key, value in row.items() if key.startswith(prefix)} \
+            if qualified else dict(row)
+
+    if qualified:
+        return {key: value for key, value in row.items()
+                if '.' not in key or key.partition('.')[0] not in qualified}
+
+    return dict(row)
+
+
+def label(node):
+    if isinstance(node, Alias):
+        return node.replacement
+
+    if isinstance(node, Column):
+        return node.name
+
+    return unparse(node)
+
+
+def projection(columns, qualified):
+    plan = [(None, expression) if isinstance(expression, All) else (name, evaluator(expression))
+            for name, expression in columns]
+
+    def project(row):
+        output = {}
+
+        for name, evaluate in plan:
+            if name is None:
+                output.update(expand(evaluate, row, qualified))
+            else:
+                output[name] = evaluate(row)
+
+        return output
+
+    return project
+
+
+def core_rows(core, sources, terms):
+    columns = [node.original if isinstance(node, Alias) else node
+               for node in core.result_column_list]
+    having = getattr(core, 'having', None)
+    named = {node.replacement: node.original
+             for node in core.result_column_list if isinstance(node, Alias)}
+    orders = [rewrite(term[0], lambda node: named[node.name]
+                      if isinstance(node, Column) and node.table is None and node.name in named
+                      else node)
+              for term in terms]
+
+    table_list = getattr(core, 'table_list', None) or ()
+    qualified = (set().union(*map(aliases, table_list))
+                 if len(table_list) > 1 or any(isinstance(node, Operation) for node in table_list)
+                 else set())
+
+    rows, expressions = group(tables(core, sources), core,
+                              columns + ([having] if having is not None else []) + orders)
+
+    columns = list(zip(map(label, core.result_column_list), expressions))
+
+    if having is not None:
+        rows = filter(predicate(expressions[len(columns)]), rows)
+
+    project = projection(columns, qualified)
+
+    if core.reduction == 'DISTINCT':
+        rows = distinct((project(row), row) for row in rows)
+    else:
+        rows = ((None, row) for row in rows)
+
+    return rows, expressions[len(expressions) - len(orders):], project
+
+
+def distinct(rows):
+    seen = set()
+
+    for output, row in rows:
+        key = tuple(output.values())
+
+        if key not in seen:
+            seen.add(key)
+            yield output, row
+
+
+def compound(select, sources):
+    core = select.select_core
+
+    if isinstance(core, SelectCore):
+        rows, _, project = core_rows(core, sources, ())
+        return (project(row) if output is None else output for output, row in rows)
+
+    kind = core.operator
+
+    left = compound(core.a, sources)
+    right = compound(core.b, sources)
+
+    if kind == ('UNION', 'ALL'):
+        return union(left, right)
+
+    if kind == ('UNION',):
+        return (output for output, _ in distinct((output, None) for output in union(left, right)))
+
+    if kind in (('INTERSECT',), ('EXCEPT',)):
+        return filtered(left, right, kind == ('INTERSECT',))
+
+    raise ValueError(f"cannot execute {' '.join(kind)}")
+
+
+def union(left, right):
+    names = None
+
+    for output in left:
+        names = names or list(output)
+        yield output
+
+    for output in right:
+        yield output if names is None else dict(zip(names, output.values()))
+
+
+def filtered(left, right, keep):
+    others = {tuple(output.values()) for output in right}
+    seen = set()
+
+    for output in left:
+        key = tuple(output.values())
+
+        if (key in others) == keep and key not in seen:
+            seen.add(key)
+            yield output
+
+
+class Descending:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def ordering(expression, direction, nulls):
+    evaluate = evaluator(expression)
+    descending = direction == 'DESC'
+    null = (0,) if (nulls == 'FIRST' if nulls is not None else not descending) else (2,)
+    wrap = Descending if descending else tuple
+
+    def key(row):
+        value = evaluate(row)
+        return null if value is None else (1, wrap((ranks.get(type(value), 0), value)))
+
+    return key
+
+
+def sort_key(terms, expressions):
+    keys = [ordering(expression, direction, nulls)
+            for (_, direction, nulls), expression in zip(terms, expressions)]
+
+    if len(keys) == 1:
+        key, = keys
+        return lambda pair: key(pair[1])
+
+    return lambda pair: tuple(key(pair[1]) for key in keys)
+
+
+def bounds(limit):
+    if limit is None:
+        return 0, None
+
+    count, offset = (evaluator(value)(Row()) for value in limit)
+    offset = offset or 0
+
+    return offset, None if count is None or count < 0 else offset + count
+
+
+def execute(statement, sources):
+    if isinstance(statement, str):
+        statement, = _pool.parse(statement)
+
+    if not isinstance(statement, Select):
+        raise ValueError(f'cannot execute {type(statement).__name__}')
+
+    sources = dict(sources)
+    with_clause = getattr(statement, 'with_clause', None)
+
+    for cte in with_clause.ctes if with_clause is not None else ():
+        rows = execute(cte.select, sources)
+
+        if cte.columns:
+            rows = (dict(zip(cte.columns, row.values())) for row in rows)
+
+        sources[cte.name] = list(rows)
+
+    terms = getattr(statement, 'order_by', None) or ()
+    limit = getattr(statement, 'limit', None)
+    core = statement.select_core
+
+    if isinstance(core, SelectCore):
+        rows, expressions, project = core_rows(core, sources, terms)
+    else:
+        terms = terms or getattr(core.b, 'order_by', None) or ()
+        limit = limit or getattr(core.b, 'limit', None)
+        rows = ((output, output) for output in compound(statement, sources))
+        expressions = [term[0] for term in terms]
+        project = None
+
+    start, stop = bounds(limit)
+
+    if terms:
+        key = sort_key(terms, expressions)
+        rows = iter(sorted(rows, key=key) if stop is None else nsmallest(stop, rows, key=key))
+
+    for output, row in islice(rows, start, stop):
+        yield project(row) if output is None else output
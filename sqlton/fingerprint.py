@@ -0,0 +1,55 @@
+from hashlib import blake2b
+from sqlton.parser import Lexer, Parser
+from sqlton.unparse import Writer
+from sqlton.ast import Statement
+
+placeholders = frozenset(('NUMERIC_LITERAL', 'STRING_LITERAL', 'PARAMETER'))
+
+
+class Normalizer(Writer):
+    def __init__(self):
+        super().__init__(minify=True)
+
+    def literal(self, value):
+        if value is None or isinstance(value, bool):
+            return super().literal(value)
+
+        self.emit('?')
+
+    def string(self, value):
+        self.emit('?')
+
+    def parameter(self, parameter):
+        self.emit('?')
+
+
+def normalize(node):
+    if isinstance(node, str):
+        node = Parser(on_error='raise').parse(Lexer().tokenize(node))
+
+    writer = Normalizer()
+
+    if isinstance(node, tuple) and node and all(isinstance(item, Statement) for item in node):
+        writer.statements(node)
+    else:
+        writer.node(node)
+
+    return writer.text()
+
+
+def normalize_tokens(statement):
+    return ' '.join('?' if token.type in placeholders
+                    else (token.value if token.type == 'IDENTIFIER' else token.type)
+                    for token in Lexer().tokenize(statement))
+
+
+def digest(text, person=b''):
+    return blake2b(text.encode(), digest_size=8, person=person).hexdigest()
+
+
+def fingerprint(node):
+    return digest(normalize(node))
+
+
+def token_fingerprint(statement):
+    return digest(normalize_tokens(statement), person=b'tokens')
@@ -0,0 +1,23 @@
+
+class Interner:
+    def __init__(self, maxsize=1 << 16):
+        self.maxsize = maxsize
+        self.nodes = {}
+
+    def __call__(self, node):
+        key = (type(node), node)
+        shared = self.nodes.get(key)
+
+        if shared is None:
+            if len(self.nodes) >= self.maxsize:
+                self.nodes.clear()
+            shared = self.nodes[key] = node
+
+        return shared
+
+
+def identity(node):
+    return node
+
+
+interner = Interner()
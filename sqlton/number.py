@@ -0,0 +1,63 @@
+from decimal import Decimal
+
+INTEGER_MAX = (1 << 63) - 1
+
+
+def numeric(text):
+    if text[:1] == '-':
+        return -numeric(text[1:])
+
+    if text[:2] in ('0x', '0X'):
+        return int(text, 16)
+
+    if '.' in text or 'e' in text or 'E' in text:
+        return float(text)
+
+    value = int(text)
+    return value if value <= INTEGER_MAX else float(text)
+
+
+class Number:
+    __slots__ = ('text', '__value')
+
+    def __init__(self, text):
+        self.text = text
+
+    @property
+    def value(self):
+        try:
+            return self.__value
+        except AttributeError:
+            self.__value = numeric(self.text)
+            return self.__value
+
+    @property
+    def decimal(self):
+        digits = self.text.lstrip('-')
+
+        if digits[:2] in ('0x', '0X'):
+            value = Decimal(int(digits, 16))
+            return -value if digits is not self.text else value
+
+        return Decimal(self.text)
+
+    def __neg__(self):
+        return Number(self.text[1:] if self.text[0] == '-' else '-' + self.text)
+
+    def __int__(self):
+        return int(self.value)
+
+    def __float__(self):
+        return float(self.value)
+
+    def __eq__(self, other):
+        if isinstance(other, Number):
+            return self.value == other.value
+
+        return self.value == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f'Number({self.text!r})'
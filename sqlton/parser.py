@@ -1,9 +1,15 @@
-from math import e
-from re import match
 from itertools import product as _product
 from functools import partial
 from sly import Lexer as _Lexer, Parser as _Parser
-from sqlton.ast import With, Create, Drop, Select, SelectCore, Delete, Insert, Replace, Update, Operation, Table, Index, All, Column, Alias, Values, CommonTableExpression
+import sys
+from copy import copy
+from itertools import chain
+from sqlton import tables
+from sqlton.positions import Positions, Spans, keep
+from sqlton.errors import SqltonSyntaxError
+from sqlton.number import numeric, Number
+from sqlton.interning import interner, identity
+from sqlton.ast import With, Create, Drop, Select, SelectCore, Delete, Insert, Replace, Update, Operation, Table, Index, All, Column, Alias, Values, CommonTableExpression, Parameter
 
 def insensitive(word):
     return (''.join(f'({character.lower()}|{character.upper()})'
@@ -16,7 +22,26 @@ def product(*variations):
                        for part in entry
                        if part is not None)
 
-decimal_number = r'((?P<mantis>([\+-]?\d+(\.\d+)?)|(\.\d+))((e|E)(?P<exponent>[\+-]?\d+))?)'
+decimal_number = r'((\d+(\.\d+)?)|(\.\d+))((e|E)[\+-]?\d+)?'
+
+keywords = {word: word
+            for word in ('CURRENT_TIMESTAMP', 'AUTOINCREMENT', 'CURRENT_DATE', 'CURRENT_TIME',
+                         'MATERIALIZED', 'CONSTRAINT', 'RETURNING', 'INTERSECT', 'RECURSIVE',
+                         'CONFLICT', 'DISTINCT', 'ROLLBACK', 'INTEGER', 'NUMERIC', 'BETWEEN',
+                         'PRIMARY', 'COLLATE', 'DEFAULT', 'INDEXED', 'DECIMAL', 'REPLACE',
+                         'NATURAL', 'DELETE', 'UPDATE', 'IGNORE', 'EXCEPT', 'HAVING', 'SELECT',
+                         'INSERT', 'VALUES', 'OFFSET', 'REGEXP', 'FILTER', 'EXISTS', 'CREATE',
+                         'MATCH', 'FIRST', 'ABORT', 'GROUP', 'INNER', 'LIMIT', 'NULLS', 'ORDER',
+                         'OUTER', 'RIGHT', 'UNION', 'USING', 'WHERE', 'TABLE', 'DROP', 'CHAR',
+                         'CLOB', 'DOUB', 'FLOA', 'REAL', 'TEXT', 'FAIL', 'INTO', 'DESC', 'FROM',
+                         'FULL', 'JOIN', 'LAST', 'LEFT', 'WITH', 'LIKE', 'GLOB', 'CAST', 'ALL',
+                         'SET', 'AND', 'ASC', 'NOT', 'KEY', 'AS', 'BY', 'ON', 'OR', 'IN', 'IS',
+                         'IF')}
+keywords |= {'TRUE': 'BOOLEAN_LITERAL',
+             'FALSE': 'BOOLEAN_LITERAL',
+             'NULL': 'NULL_LITERAL'}
+
+modes = ('print', 'raise', 'recover')
 
 class Lexer(_Lexer):
     tokens = {CONSTRAINT, CONFLICT, TABLE,
@@ -30,6 +55,7 @@ class Lexer(_Lexer):
               STRING_LITERAL,
               BOOLEAN_LITERAL,
               NULL_LITERAL,
+              PARAMETER,
               CURRENT_TIME,
               CURRENT_DATE,
               CURRENT_TIMESTAMP,
@@ -67,113 +93,60 @@ class Lexer(_Lexer):
               TEXT,
               DECIMAL}
 
-    CURRENT_TIMESTAMP = insensitive("CURRENT_TIMESTAMP")
-    AUTOINCREMENT = insensitive("AUTOINCREMENT")
-    CURRENT_DATE = insensitive("CURRENT_DATE")
-    CURRENT_TIME = insensitive("CURRENT_TIME")
-    MATERIALIZED = insensitive("MATERIALIZED")
-    CONSTRAINT = insensitive("CONSTRAINT")
-    RETURNING = insensitive("RETURNING")
-    INTERSECT = insensitive("INTERSECT")
-    RECURSIVE = insensitive("RECURSIVE")
-    CONFLICT = insensitive("CONFLICT")
-    DISTINCT = insensitive("DISTINCT")
-    ROLLBACK = insensitive("ROLLBACK")
-    INTEGER = insensitive("INTEGER")
-    NUMERIC = insensitive("NUMERIC")
-    BETWEEN = insensitive("BETWEEN")
-    PRIMARY = insensitive("PRIMARY")
-    COLLATE = insensitive("COLLATE")
-    DEFAULT = insensitive("DEFAULT")
-    INDEXED = insensitive("INDEXED")
-    DECIMAL = insensitive("DECIMAL")
-    REPLACE = insensitive("REPLACE")
-    NATURAL = insensitive("NATURAL")
-    DELETE = insensitive("DELETE")
-    UPDATE = insensitive("UPDATE")
-    IGNORE = insensitive("IGNORE")
-    EXCEPT = insensitive("EXCEPT")
-    HAVING = insensitive("HAVING")
-    SELECT = insensitive("SELECT")
-    INSERT = insensitive("INSERT")
-    VALUES = insensitive("VALUES")
-    OFFSET = insensitive("OFFSET")
-    REGEXP = insensitive("REGEXP")
-    FILTER = insensitive("FILTER")
-    EXISTS = insensitive("EXISTS")
-    CREATE = insensitive("CREATE")
-    MATCH = insensitive("MATCH")
-    FIRST = insensitive("FIRST")
-    ABORT = insensitive("ABORT")
-    GROUP = insensitive("GROUP")
-    INNER = insensitive("INNER")
-    LIMIT = insensitive("LIMIT")
-    NULLS = insensitive("NULLS")
-    ORDER = insensitive("ORDER")
-    OUTER = insensitive("OUTER")
-    RIGHT = insensitive("RIGHT")
-    UNION = insensitive("UNION")
-    USING = insensitive("USING")
-    WHERE = insensitive("WHERE")
-    TABLE = insensitive("TABLE")
-
     ignore = ' \t'
 
+    def __init__(self, lazy_numbers=False, on_error='raise'):
+        if on_error not in modes:
+            raise ValueError(f'unknown error mode {on_error!r}')
+
+        self.lazy_numbers = lazy_numbers
+        self.on_error = on_error
+
+    def tokenize(self, text, lineno=1, index=0):
+        self.parameters = 0
+        self.names = {}
+        return super().tokenize(text, lineno, index)
+
     @_(r'((\r?\n)|\r)+')
     def ignore_newline(self, t):
         self.lineno += max(t.value.count('\n'), t.value.count('\r'))
 
-    @_(*(insensitive(word)
-         for word in ('true', 'false')))
-    def BOOLEAN_LITERAL(self, t):
-        t.value = (t.value.lower() == 'true')
-        return t
-        
-    @_(insensitive('NULL'))
-    def NULL_LITERAL(self, t):
-        t.value = None
-        return t
-
-    DROP = insensitive("DROP")
-    CHAR = insensitive("CHAR")
-    CLOB = insensitive("CLOB")
-    DOUB = insensitive("DOUB")
-    FLOA = insensitive("FLOA")
-    REAL = insensitive("REAL")
-    TEXT = insensitive("TEXT")
-    FAIL = insensitive("FAIL")
-    INTO = insensitive("INTO")
-    DESC = insensitive("DESC")
-    FROM = insensitive("FROM")
-    FULL = insensitive("FULL")
-    JOIN = insensitive("JOIN")
-    LAST = insensitive("LAST")
-    LEFT = insensitive("LEFT")
-    WITH = insensitive("WITH")
-    LIKE = insensitive("LIKE")
-    GLOB = insensitive("GLOB")
-    CAST = insensitive("CAST")
-    ALL = insensitive("ALL")
-    SET = insensitive("SET")
-    AND = insensitive("AND")
-    ASC = insensitive("ASC")
-    NOT = insensitive("NOT")
-    KEY = insensitive("KEY")
-    AS = insensitive("AS")
-    BY = insensitive("BY")
-    ON = insensitive("ON")
-    OR = insensitive("OR")
-    IN = insensitive("IN")
-    IS = insensitive("IS")
-    IF = insensitive("IF")
-    
     @_(r'([a-zA-Z_]\w*)',
        r'(`[^`]*`)')
     def IDENTIFIER(self, t):
        if t.value[0] == '`' and t.value[-1] == '`':
-           t.value = t.value[1:-1]
+           t.value = sys.intern(t.value[1:-1])
+           return t
+
+       t.type = keywords.get(t.value.upper(), 'IDENTIFIER')
+
+       if t.type == 'IDENTIFIER':
+           t.value = sys.intern(t.value)
+
+       if t.type == 'BOOLEAN_LITERAL':
+           t.value = (t.value.upper() == 'TRUE')
+       elif t.type == 'NULL_LITERAL':
+           t.value = None
+
        return t
 
+    @_(r'0[xX][\dA-Fa-f]+',
+       decimal_number)
+    def NUMERIC_LITERAL(self, t):
+        t.value = Number(t.value) if self.lazy_numbers else numeric(t.value)
+        return t
+
+    def error(self, t):
+        if self.on_error == 'raise':
+            raise SqltonSyntaxError(f'illegal character {t.value[0]!r}',
+                                    self.index, self.lineno, 'ERROR', t.value[0])
+
+        t.type = 'ERROR'
+        t.value = t.value[0]
+        t.end = self.index + 1
+        self.index += 1
+        return t
+
     COMMA = r','
     SEMICOLON = r';'
     DOT = r'\.'
@@ -191,40 +164,51 @@ class Lexer(_Lexer):
     MULTIPLICATION = r'\*'
     DIVISION = r'/'
     
-    @_(decimal_number,
-       r'0x[\dA-Fa-f]+')
-    def NUMERIC_LITERAL(self, t):
-        if t.value.startswith('0x'):
-            t.value = int(t.value[2:], 16)
-            return t
-        
-        value = t.value
-        if t.value.startswith('.'):
-            value = '0' + t.value
-
-        groups = {key:((int if not '.' in value else float)(value)
-                       if value is not None
-                       else 0)
-                  for key, value
-                  in match(decimal_number, value).groupdict().items()}
-
-        t.value = groups['mantis']
-        
-        if 'exponent' in groups.keys() and groups.get('exponent') != 0:
-            t.value *= (e ** groups.get('exponent'))
-        
-        return t
-        
     @_(r'"[^"]*"',
        r'\'[^\']*\'')
     def STRING_LITERAL(self, t):
         t.value = t.value[1:-1]
         return t
 
+    @_(r'\?\d*',
+       r'[:@$][a-zA-Z_]\w*')
+    def PARAMETER(self, t):
+        if t.value[0] != '?':
+            if t.value not in self.names:
+                self.parameters += 1
+                self.names[t.value] = self.parameters
+
+            t.value = Parameter(t.value, self.names[t.value])
+            return t
+
+        index = int(t.value[1:]) if len(t.value) > 1 else self.parameters + 1
+
+        if index < 1:
+            if self.on_error == 'raise':
+                raise SqltonSyntaxError(f'parameter {t.value!r} out of range',
+                                        t.index, self.lineno, 'PARAMETER', t.value)
+
+            t.type = 'ERROR'
+            return t
+
+        self.parameters = max(self.parameters, index)
+        t.value = Parameter(index)
+        return t
+
+
+class Abort(Exception):
+    pass
+
+
+class Resync(Exception):
+    def __init__(self, statements):
+        self.statements = statements
+
 
 class Parser(_Parser):
     tokens = Lexer.tokens
     start = 'statement_list'
+    track_positions = False
     
     precedence = (
         ('left', SEMICOLON),
@@ -236,7 +220,7 @@ class Parser(_Parser):
         ('left', USING, ON),
         ('left', OR),
         ('left', AND),
-        ('left', EQUAL, DIFFERENCE, LESS_OR_EQUAL, MORE_OR_EQUAL, LESS, MORE, MATCH, LIKE, GLOB),
+        ('left', EQUAL, DIFFERENCE, LESS_OR_EQUAL, MORE_OR_EQUAL, LESS, MORE, MATCH, LIKE, GLOB, IS),
         ('left', PLUS, MINUS),
         ('left', MULTIPLICATION, DIVISION),
         ('left', IN),
@@ -247,19 +231,137 @@ class Parser(_Parser):
         ('right', UALL),
     )
 
+    # sly calls cls.__build_lrtables() from inside its own Parser class, so the
+    # hook has to be spelled with sly's mangled name to keep working whatever
+    # this subclass is called
+    @classmethod
+    def _Parser__build_lrtables(cls):
+        cls._lrtable = tables.load(cls._grammar)
+
+        if cls._lrtable is None:
+            super()._Parser__build_lrtables()
+            cls._lrtable = tables.dump(cls._grammar, cls._lrtable)
+
+        return True
+
+    @classmethod
+    def __tracked(cls):
+        if '_tracked' not in cls.__dict__:
+            grammar = copy(cls._grammar)
+            grammar.Productions = [copy(production) for production in cls._grammar.Productions]
+
+            for production in grammar.Productions:
+                if production.func is not None:
+                    production.func = keep(production.func)
+
+            cls._tracked = grammar
+
+        return cls._tracked
+
+    def __init__(self, positions=False, on_error='print', intern=False):
+        if on_error not in modes:
+            raise ValueError(f'unknown error mode {on_error!r}')
+
+        if positions and intern:
+            raise ValueError('interned nodes are shared between occurrences, '
+                             'positions can not be tracked for them')
+
+        self.positions = None
+        self.errors = []
+        self.on_error = on_error
+        self.shared = interner if intern else identity
+        self.__record = positions
+
+    def parse(self, tokens):
+        if self.errors:
+            self.errors = []
+
+        if not self.__record:
+            return self.__parse(tokens)
+
+        tokens = list(tokens)
+        statements = self.__parse(iter(tokens))
+        self.positions = None if statements is None else Positions(statements, tokens, self.__replay)
+
+        return statements
+
+    def __parse(self, tokens):
+        try:
+            return super().parse(tokens)
+        except Abort:
+            return None
+        except Resync as resync:
+            statements = resync.statements
+
+        while True:
+            token = next(self.tokens, None)
+
+            if token is None:
+                return tuple(statements)
+
+            try:
+                return (*statements, *super().parse(chain((token,), self.tokens)))
+            except Resync as resync:
+                statements += resync.statements
+
+    def __replay(self, tokens):
+        parser = type(self)(on_error='recover' if self.on_error == 'recover' else 'raise')
+        parser.track_positions = True
+        parser._grammar = self.__tracked()
+        parser._line_positions = {}
+        parser._index_positions = Spans()
+        parser._reduced = []
+
+        return parser.__parse(iter(tokens)), parser._index_positions, parser._reduced
+
+    def error(self, token):
+        expected = tuple(sorted(kind
+                                for kind in self._lrtable.lr_action[self.state]
+                                if kind != 'error'))
+
+        if token is None:
+            error = SqltonSyntaxError('unexpected end of input', expected=expected)
+        elif token.type == 'ERROR':
+            error = SqltonSyntaxError(f'illegal character {token.value!r}',
+                                      token.index, token.lineno, token.type, token.value, expected)
+        else:
+            error = SqltonSyntaxError(f'unexpected {token.type} {token.value!r}',
+                                      token.index, token.lineno, token.type, token.value, expected)
+
+        if self.on_error == 'raise':
+            raise error
+
+        if self.on_error == 'print':
+            sys.stderr.write(f'sqlton: {error}\n')
+            raise Abort()
+
+        self.errors.append(error)
+
+        while token is not None and token.type != 'SEMICOLON':
+            token = next(self.tokens, None)
+
+        symbols = self.symstack
+        statements = (list(symbols[1].value)
+                      if len(symbols) > 1 and symbols[1].type == '_statement_list'
+                      else [])
+        statements.append(None)
+
+        raise Resync(statements)
+
 
     @_('_statement_list SEMICOLON',
        '_statement_list')
     def statement_list(self, p):
-        return p._statement_list
+        return tuple(p._statement_list)
         
     @_('_statement_list SEMICOLON statement')
     def _statement_list(self, p):
-        return (*p._statement_list, p.statement)
+        p._statement_list.append(p.statement)
+        return p._statement_list
     
     @_('statement')
     def _statement_list(self, p):
-        return (p.statement,)
+        return [p.statement]
 
     @_('create', 'drop', 'delete', 'insert', 'select', 'update')
     def statement(self, p):
@@ -288,9 +390,9 @@ class Parser(_Parser):
                           #(None, 'table_constraint_list',),
                           ('RP',)))))
     def create(self, p):
-        return Create(table=(Table(p.IDENTIFIER1, p.IDENTIFIER0)
-                             if hasattr(p, 'DOT')
-                             else Table(p.IDENTIFIER)),
+        return Create(table=self.shared(Table(p.IDENTIFIER1, p.IDENTIFIER0)
+                                        if hasattr(p, 'DOT')
+                                        else Table(p.IDENTIFIER)),
                       select=(p.select
                               if hasattr(p, 'select')
                               else None),
@@ -303,7 +405,9 @@ class Parser(_Parser):
         
     @_('column_definition_list COMMA column_definition')
     def column_definition_list(self, p):
-        return p.column_definition_list | dict((p.column_definition,))
+        name, definition = p.column_definition
+        p.column_definition_list[name] = definition
+        return p.column_definition_list
 
     @_('column_definition')
     def column_definition_list(self, p):
@@ -324,18 +428,22 @@ class Parser(_Parser):
                                       'NULL_LITERAL')
                          if hasattr(p, kind))
                   else None),
-                 (p.column_constraint_lista
+                 (p.column_constraint_list
                   if hasattr(p, 'column_constraint_list')
                   else ())))
 
-    @_('column_constraint_list column_constraint')
+    @_('_column_constraint_list')
     def column_constraint_list(self, p):
-        return (*p.column_constraint_list,
-                p.column_constraint)
+        return tuple(p._column_constraint_list)
+
+    @_('_column_constraint_list column_constraint')
+    def _column_constraint_list(self, p):
+        p._column_constraint_list.append(p.column_constraint)
+        return p._column_constraint_list
 
     @_('column_constraint')
-    def column_constraint_list(self, p):
-        return (p.column_constraint,)
+    def _column_constraint_list(self, p):
+        return [p.column_constraint]
     
     @_(*product(('CONSTRAINT IDENTIFIER', None),
                 ('primary_key_constraint',)))
@@ -370,8 +478,8 @@ class Parser(_Parser):
                 ('IDENTIFIER DOT IDENTIFIER', 'IDENTIFIER')))
     def drop(self, p):
         return Drop(if_exists=hasattr(p, 'EXISTS'),
-                    table=Table(p[-1],
-                                p[-3] if hasattr(p, 'DOT') else None))
+                    table=self.shared(Table(p[-1],
+                                            p[-3] if hasattr(p, 'DOT') else None)))
     
     # TODO: upsert close
     @_(*product(('with_clause', None),
@@ -395,7 +503,7 @@ class Parser(_Parser):
         return Directive(with_clause=p.with_clause if hasattr(p, 'with_clause') else None,
                          alternative=alternative,
                          target=p.insert_target,
-                         columns=p.column_name_list if hasattr(p, 'column_name_list') else (All(),),
+                         columns=p.column_name_list if hasattr(p, 'column_name_list') else (self.shared(All()),),
                          values=p.select_core if hasattr(p, 'select_core') else None,
                          upsert=p.upsert_clause if hasattr(p, 'upsert_clause') else None,
                          returns=p.returning_clause if hasattr(p, 'returning_clause') else None)
@@ -415,10 +523,7 @@ class Parser(_Parser):
                 ('IDENTIFIER',),
                 ('AS IDENTIFIER', 'AS STRING_LITERAL', None)))
     def insert_target(self, p):
-        table = Table(p[0])
-        
-        if hasattr(p, 'DOT'):
-            table = Table(p[2], p[0])
+        table = self.shared(Table(p[2], p[0]) if hasattr(p, 'DOT') else Table(p[0]))
 
         if hasattr(p, 'AS'):
             table = Alias(table, p[-1])
@@ -457,13 +562,18 @@ class Parser(_Parser):
     def alternative(self, p):
         return (p[1] if hasattr(p, 'OR') else None)
     
-    @_('assignment')
+    @_('_assignment_list')
     def assignment_list(self, p):
-        return (p.assignment,)
+        return tuple(p._assignment_list)
+
+    @_('assignment')
+    def _assignment_list(self, p):
+        return [p.assignment]
         
-    @_('assignment_list COMMA assignment')
-    def assignment_list(self, p):
-        return (*p.assignment_list, p.assignment)
+    @_('_assignment_list COMMA assignment')
+    def _assignment_list(self, p):
+        p._assignment_list.append(p.assignment)
+        return p._assignment_list
     
     @_(*product(('LP column_name_list RP EQUAL',),
                 ('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call')))
@@ -487,13 +597,18 @@ class Parser(_Parser):
     def with_clause(self, p):
         return With(p.cte_list)
 
-    @_('cte')
+    @_('_cte_list')
     def cte_list(self, p):
-        return (p.cte,)
+        return tuple(p._cte_list)
 
-    @_('cte_list COMMA cte')
-    def cte_list(self, p):
-        return (*p.cte_list, p.cte)
+    @_('cte')
+    def _cte_list(self, p):
+        return [p.cte]
+
+    @_('_cte_list COMMA cte')
+    def _cte_list(self, p):
+        p._cte_list.append(p.cte)
+        return p._cte_list
     
     @_(*product(('IDENTIFIER',),
                 ('LP column_name_list RP', None),
@@ -506,15 +621,25 @@ class Parser(_Parser):
         if hasattr(p, 'MATERIALIZED'):
             materialized = not hasattr(p, 'NOT')
         
-        return CommonTableExpression(p.IDENTIFIER, p.column_name_list, materialized, p.select)
+        return CommonTableExpression(p.IDENTIFIER,
+                                     (p.column_name_list
+                                      if hasattr(p, 'column_name_list')
+                                      else None),
+                                     materialized,
+                                     p.select)
+
+    @_('_column_name_list')
+    def column_name_list(self, p):
+        return tuple(p._column_name_list)
 
     @_('IDENTIFIER')
-    def column_name_list(self, p):
-        return (p.IDENTIFIER,)
+    def _column_name_list(self, p):
+        return [p.IDENTIFIER]
 
-    @_('column_name_list COMMA IDENTIFIER')
-    def column_name_list(self, p):
-        return (*p.column_name_list, p.IDENTIFIER)
+    @_('_column_name_list COMMA IDENTIFIER')
+    def _column_name_list(self, p):
+        p._column_name_list.append(p.IDENTIFIER)
+        return p._column_name_list
 
     @_(*product(('SELECT reduction result_column_list',),
                 (None, 'FROM table_list',),
@@ -533,13 +658,18 @@ class Parser(_Parser):
     def select_core(self, p):
         return Values(p.row_list)
 
-    @_('LP expr_list RP')
+    @_('_row_list')
     def row_list(self, p):
-        return (p.expr_list,)
+        return tuple(p._row_list)
 
-    @_('row_list COMMA LP expr_list RP')
-    def row_list(self, p):
-        return (*p.row_list, p.expr_list)
+    @_('LP expr_list RP')
+    def _row_list(self, p):
+        return [p.expr_list]
+
+    @_('_row_list COMMA LP expr_list RP')
+    def _row_list(self, p):
+        p._row_list.append(p.expr_list)
+        return p._row_list
     
 
     @_(*product(('select',),
@@ -547,9 +677,9 @@ class Parser(_Parser):
                  'UNION', 'INTERSECT', 'EXCEPT'),
                 ('select %prec UALL',)))
     def select(self, p):
-        return Operation(tuple(p[index].upper()
-                               for index
-                               in range(1, len(p) - 1)),
+        return Operation(self.shared(tuple(p[index].upper()
+                                           for index
+                                           in range(1, len(p) - 1))),
                          p[0], p[-1])
     
     @_('DISTINCT',
@@ -558,25 +688,30 @@ class Parser(_Parser):
     def reduction(self, p):
         return (p[0].upper() if len(p) else None)
 
-    @_('result_column')
+    @_('_result_column_list')
     def result_column_list(self, p):
-        return (p[0],)
+        return tuple(p._result_column_list)
 
-    @_('result_column_list COMMA result_column')
-    def result_column_list(self, p):
-        return (*p.result_column_list, p.result_column)
+    @_('result_column')
+    def _result_column_list(self, p):
+        return [p[0]]
+
+    @_('_result_column_list COMMA result_column')
+    def _result_column_list(self, p):
+        p._result_column_list.append(p.result_column)
+        return p._result_column_list
 
     @_('IDENTIFIER DOT IDENTIFIER DOT MULTIPLICATION')
     def result_column(self, p):
-        return All(Table(p[2], p[0]))
+        return self.shared(All(self.shared(Table(p[2], p[0]))))
 
     @_('IDENTIFIER DOT MULTIPLICATION')
     def result_column(self, p):
-        return All(Table(p[0]))
+        return self.shared(All(self.shared(Table(p[0]))))
 
     @_('MULTIPLICATION')
     def result_column(self, p):
-        return All()
+        return self.shared(All())
 
     @_('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call')
     def result_column(self, p):
@@ -588,13 +723,18 @@ class Parser(_Parser):
     def result_column(self, p):
         return Alias(p[0], p[-1])
 
-    @_('table')
+    @_('_table_list')
     def table_list(self, p):
-        return (p.table,)
+        return tuple(p._table_list)
 
-    @_('table_list COMMA table')
-    def table_list(self, p):
-        return (*p.table_list, p.table)
+    @_('table')
+    def _table_list(self, p):
+        return [p.table]
+
+    @_('_table_list COMMA table')
+    def _table_list(self, p):
+        p._table_list.append(p.table)
+        return p._table_list
 
     @_(*product(('IDENTIFIER DOT IDENTIFIER', 'IDENTIFIER'),
                 ('AS', None),
@@ -632,7 +772,7 @@ class Parser(_Parser):
         if hasattr(p, 'INDEXED') and hasattr(p, 'BY'):
             index_name = p[-1]
 
-        table = Table(table_name, schema_name)
+        table = self.shared(Table(table_name, schema_name))
 
         if index_name is not None:
             table = Index(table, index_name)
@@ -701,7 +841,7 @@ class Parser(_Parser):
     @_(*product(('WHERE',),
                 ('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call')))
     def where(self, p):
-        return p.expr_boolean
+        return p[1]
 
     @_('GROUP BY expr_list')
     def group(self, p):
@@ -710,19 +850,24 @@ class Parser(_Parser):
     @_(*product(('HAVING',),
                 ('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call')))
     def having(self, p):
-        return p.expr_boolean
+        return p[1]
 
     @_('ORDER BY ordering_term_list')
     def order_by(self, p):
         return p.ordering_term_list
 
-    @_('ordering_term')
+    @_('_ordering_term_list')
     def ordering_term_list(self, p):
-        return (p.ordering_term,)
+        return tuple(p._ordering_term_list)
 
-    @_('ordering_term COMMA ordering_term_list')
-    def ordering_term_list(self, p):
-        return (p.ordering_term, *p.ordering_term_list)
+    @_('ordering_term')
+    def _ordering_term_list(self, p):
+        return [p.ordering_term]
+
+    @_('_ordering_term_list COMMA ordering_term')
+    def _ordering_term_list(self, p):
+        p._ordering_term_list.append(p.ordering_term)
+        return p._ordering_term_list
 
     @_(*product(('expr_string', 'column', 'call'),
                 (None, 'ASC', 'DESC'),
@@ -750,14 +895,19 @@ class Parser(_Parser):
         else:
             return (p[1], 0)
 
-    @_(*product(('expr_list COMMA',),
+    @_(*product(('_expr_list COMMA',),
                 ('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call')))
+    def _expr_list(self, p):
+        p._expr_list.append(p[2])
+        return p._expr_list
+
+    @_('_expr_list')
     def expr_list(self, p):
-        return (*p.expr_list, p[2])
+        return tuple(p._expr_list)
 
     @_('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call')
-    def expr_list(self, p):
-        return (p[0],)
+    def _expr_list(self, p):
+        return [p[0]]
 
     @_('LP expr_boolean RP')
     def expr_boolean(self, p):
@@ -803,10 +953,8 @@ class Parser(_Parser):
                 ('expr_numeric', 'call', 'column')))
     def expr_boolean(self, p):
         return Operation(('AND',),
-                         Operation(('MORE_OR_EQUAL',),
-                                   p[2], p[0]),
-                         Operation(('LESS_OR_EQUAL',),
-                                   p[4], p[0]))
+                         Operation(('>=',), p[0], p[2]),
+                         Operation(('<=',), p[0], p[4]))
 
     @_(*product(('expr_numeric', 'call', 'column'),
                 ('NOT BETWEEN',),
@@ -815,9 +963,9 @@ class Parser(_Parser):
                 ('expr_numeric', 'call', 'column'),
                 ('%prec UNOT',)))
     def expr_boolean(self, p):
-        return Operation(('AND',),
-                         Operation(('LESS',), p[3], p[0]),
-                         Operation(('MORE',), p[5], p[0]))
+        return Operation(('OR',),
+                         Operation(('<',), p[0], p[3]),
+                         Operation(('>',), p[0], p[5]))
     
     @_(*product(('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call'),
                 (None, 'NOT'),
@@ -849,8 +997,8 @@ class Parser(_Parser):
                          else ())
 
     def expr_binary(self, p):
-        return Operation(tuple(p[index].upper()
-                               for index in range(1, len(p) - 1)),
+        return Operation(self.shared(tuple(p[index].upper()
+                                           for index in range(1, len(p) - 1))),
                          p[0],
                          p[-1])
     
@@ -868,7 +1016,7 @@ class Parser(_Parser):
                 ('NOT', None),
                 ('NULL_LITERAL',)))
     def expr_boolean(self, p):
-        return Operation(('!=' if hasattr(p, 'NOT') else '=',),
+        return Operation(('IS', 'NOT') if hasattr(p, 'NOT') else ('IS',),
                          p[0],
                          None)
     
@@ -902,19 +1050,23 @@ class Parser(_Parser):
 
     @_('IDENTIFIER DOT IDENTIFIER DOT IDENTIFIER')
     def column(self, p):
-        return Column(p[4], Table(p[2], p[0]))
+        return self.shared(Column(p[4], self.shared(Table(p[2], p[0]))))
     
     @_('IDENTIFIER DOT IDENTIFIER')
     def column(self, p):
-        return Column(p[2], Table(p[0]))
+        return self.shared(Column(p[2], self.shared(Table(p[0]))))
 
     @_('IDENTIFIER')
     def column(self, p):
-        return Column(p[0])
+        return self.shared(Column(p[0]))
 
     @_('LP column RP')
     def column(self, p):
         return p.column
+
+    @_('PARAMETER')
+    def column(self, p):
+        return p.PARAMETER
     
     @_(*product(('DISTINCT', None),
                 ('expr_list',),
@@ -982,7 +1134,11 @@ class Parser(_Parser):
                 ('RP',)))
     def expr_numeric(self, p):
         return self.cast(p,
-                         int if hasattr(p, 'INTEGER') else str)
+                         (int
+                          if hasattr(p, 'INTEGER')
+                          else (float
+                                if any(hasattr(p, kind) for kind in ('REAL', 'FLOA', 'DOUB'))
+                                else Number)))
 
     @_(*product(('CAST LP',),
                 ('expr_boolean', 'expr_numeric', 'expr_string', 'expr_null', 'column', 'call'),
@@ -990,7 +1146,7 @@ class Parser(_Parser):
                 ('NULL_LITERAL',),
                 ('RP',)))
     def expr_null(self, p):
-        return self.cast(p[2], None)
+        return self.cast(p, None)
 
     @_('EXISTS LP select RP')
     def expr_boolean(self, p):
@@ -1006,7 +1162,12 @@ class Parser(_Parser):
 
     @_('MINUS expr_numeric %prec UMINUS')
     def expr_numeric(self, p):
-        return Operation(('MINUS',), None, p[1])
+        operand = p[1]
+
+        if hasattr(operand, '__neg__'):
+            return -operand
+
+        return Operation(('MINUS',), None, operand)
 
     @_('CURRENT_TIMESTAMP',
        'CURRENT_TIME',
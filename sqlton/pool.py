@@ -0,0 +1,26 @@
+from collections import deque
+from contextlib import contextmanager
+from sqlton.parser import Lexer, Parser
+
+
+class ParserPool:
+    def __init__(self, size=None, on_error='print', intern=False):
+        self.on_error = on_error
+        self.intern = intern
+        self.__pairs = deque(maxlen=size)
+
+    @contextmanager
+    def acquire(self):
+        try:
+            pair = self.__pairs.pop()
+        except IndexError:
+            pair = (Lexer(on_error=self.on_error), Parser(on_error=self.on_error, intern=self.intern))
+
+        try:
+            yield pair
+        finally:
+            self.__pairs.append(pair)
+
+    def parse(self, statement):
+        with self.acquire() as (lexer, parser):
+            return parser.parse(lexer.tokenize(statement))
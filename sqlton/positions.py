@@ -0,0 +1,50 @@
+from sqlton.visit import walk, leaves
+
+
+def keep(func):
+    def reduce(self, p):
+        value = func(self, p)
+        self._reduced.append(value)
+        return value
+
+    return reduce
+
+
+class Spans(dict):
+    __setitem__ = dict.setdefault
+
+
+class Positions:
+    def __init__(self, tree, tokens, replay):
+        self.tree = tree
+        self.__tokens = tokens
+        self.__replay = replay
+        self.__spans = None
+
+    def __resolve(self):
+        if self.__spans is None:
+            tree, spans, _ = self.__replay(self.__tokens)
+            self.__spans = {id(node): spans[id(other)]
+                            for node, other in zip(walk(self.tree), walk(tree))
+                            if type(node) not in leaves and id(other) in spans}
+            self.__tokens = self.__replay = None
+
+        return self.__spans
+
+    def __getitem__(self, node):
+        if type(node) in leaves:
+            raise KeyError(node)
+
+        return self.__resolve()[id(node)]
+
+    def __contains__(self, node):
+        return type(node) not in leaves and id(node) in self.__resolve()
+
+    def __len__(self):
+        return len(self.__resolve())
+
+    def get(self, node, default=None):
+        if type(node) in leaves:
+            return default
+
+        return self.__resolve().get(id(node), default)
@@ -0,0 +1,55 @@
+from re import compile as _compile
+from functools import partial
+from sqlton.parser import Lexer, Parser
+
+special = _compile(r';|\'[^\']*\'|"[^"]*"|`[^`]*`|[\'"`]')
+
+
+def split_statements(chunks):
+    pending = []
+    quote = None
+
+    for chunk in chunks:
+        start = position = 0
+
+        if quote is not None:
+            end = chunk.find(quote)
+            if end < 0:
+                pending.append(chunk)
+                continue
+            position = end + 1
+            quote = None
+
+        for match in special.finditer(chunk, position):
+            text = match.group()
+
+            if text == ';':
+                pending.append(chunk[start:match.start()])
+                yield ''.join(pending)
+                pending = []
+                start = match.end()
+            elif len(text) == 1:
+                quote = text
+                break
+
+        if start < len(chunk):
+            pending.append(chunk[start:])
+
+    if pending:
+        yield ''.join(pending)
+
+
+def parse_stream(source, chunksize=1 << 16, on_error='print'):
+    if hasattr(source, 'read'):
+        source = iter(partial(source.read, chunksize), '')
+
+    lexer = Lexer(on_error=on_error)
+    parser = Parser(on_error=on_error)
+    lineno = 1
+
+    for text in split_statements(source):
+        if text.strip():
+            statements = parser.parse(lexer.tokenize(text, lineno=lineno))
+            yield statements[0] if statements else None
+
+        lineno += text.count('\n')
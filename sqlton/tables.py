@@ -0,0 +1,73 @@
+from os import environ, replace, unlink, chmod
+from os.path import dirname, join
+from hashlib import sha256
+from collections import namedtuple
+from pickle import load as _load, dump as _dump, HIGHEST_PROTOCOL
+from tempfile import NamedTemporaryFile
+import sly
+
+Tables = namedtuple('Tables', ('signature', 'lr_action', 'lr_goto', 'defaulted_states'))
+
+DEFAULT_PATH = join(dirname(__file__), 'parsetab.pickle')
+
+
+def path():
+    return environ.get('SQLTON_TABLES', DEFAULT_PATH)
+
+
+def signature(grammar):
+    precedence = sorted(grammar.Precedence.items())
+    return sha256(repr((sly.__version__, str(grammar), precedence)).encode()).hexdigest()
+
+
+def load(grammar, filename=None):
+    filename = path() if filename is None else filename
+
+    if not filename:
+        return None
+
+    try:
+        with open(filename, 'rb') as file:
+            tables = _load(file)
+    except Exception:
+        return None
+
+    if not isinstance(tables, Tables) or tables.signature != signature(grammar):
+        return None
+
+    return tables
+
+
+def dump(grammar, lrtable, filename=None):
+    filename = path() if filename is None else filename
+    tables = Tables(signature(grammar),
+                    lrtable.lr_action,
+                    lrtable.lr_goto,
+                    lrtable.defaulted_states)
+
+    if not filename:
+        return tables
+
+    file = None
+
+    try:
+        with NamedTemporaryFile('wb', dir=dirname(filename) or None, suffix='.tmp', delete=False) as file:
+            _dump(tables, file, protocol=HIGHEST_PROTOCOL)
+        chmod(file.name, 0o644)
+        replace(file.name, filename)
+    except OSError:
+        if file is not None:
+            try:
+                unlink(file.name)
+            except OSError:
+                pass
+
+    return tables
+
+
+if __name__ == '__main__':
+    from sys import argv
+    from sqlton import tables
+    from sqlton.parser import Parser
+
+    tables.dump(Parser._grammar, Parser._lrtable, argv[1] if len(argv) > 1 else None)
@@ -0,0 +1,526 @@
+from re import compile as _compile
+from sqlton.parser import keywords
+from sqlton.number import Number
+from sqlton.ast import (Statement, Create, Drop, Select, SelectCore, Insert, Replace, Update, Delete,
+                        Operation, Table, Index, Column, All, Alias, Values, ColumnarValues, Parameter)
+
+plain = _compile(r'[a-zA-Z_]\w*')
+
+symbols = frozenset(('=', '==', '!=', '<>', '<', '<=', '>', '>=', '*', '/', '+', '-'))
+
+functions = frozenset(('CURRENT_TIMESTAMP', 'CURRENT_TIME', 'CURRENT_DATE'))
+
+kinds = {str: 'TEXT', int: 'INTEGER', float: 'REAL', Number: 'NUMERIC', None: 'NULL'}
+
+levels = {'OR': 1, 'AND': 2, '+': 5, '-': 5, '*': 6, '/': 6, 'COLLATE': 7, 'CALL': 9, 'CAST': 9}
+
+prefixes = {'NOT': 3, 'MINUS': 8}
+
+special = frozenset(('UNION', 'INTERSECT', 'EXCEPT', 'JOIN', 'CALL', 'CAST', 'COLLATE', 'EXISTS', 'IS'))
+
+
+def infix(node):
+    return (isinstance(node, Operation)
+            and node.a is not None
+            and node.operator[0] not in special
+            and node.operator[-1] != 'IN')
+
+
+def chain(operation):
+    bound = level(operation)
+    links = []
+
+    while infix(operation) and level(operation) == bound:
+        operator, operation, b = operation
+        links.append((operator, b))
+
+    links.reverse()
+    return operation, links
+
+
+def level(node):
+    if not isinstance(node, Operation):
+        return 9
+
+    operator, a, _ = node
+
+    if a is None:
+        return prefixes.get(operator[0], 9)
+
+    return levels.get(operator[0], 4)
+
+
+class Writer:
+    def __init__(self, minify=False):
+        self.parts = []
+        self.emit = self.parts.append
+        self.comma = ',' if minify else ', '
+        self.minify = minify
+
+    def text(self):
+        return ''.join(self.parts)
+
+    def node(self, node):
+        method = self.dispatch.get(type(node))
+
+        if method is not None:
+            return getattr(self, method)(node)
+
+        if isinstance(node, Statement):
+            raise TypeError(f'unsupported statement {type(node).__name__}')
+
+        if isinstance(node, tuple):
+            return self.parenthesized(node)
+
+        return self.literal(node)
+
+    def sequence(self, nodes, write=None):
+        write = self.node if write is None else write
+
+        for index, node in enumerate(nodes):
+            if index:
+                self.emit(self.comma)
+            write(node)
+
+    def parenthesized(self, nodes, write=None):
+        self.emit('(')
+        self.sequence(nodes, write)
+        self.emit(')')
+
+    def identifier(self, name):
+        if plain.fullmatch(name) and name.upper() not in keywords:
+            self.emit(name)
+        elif '`' not in name:
+            self.emit(f'`{name}`')
+        else:
+            raise ValueError(f'identifier {name!r} can not be quoted')
+
+    def literal(self, value):
+        if value is None:
+            self.emit('NULL')
+        elif value is True:
+            self.emit('TRUE')
+        elif value is False:
+            self.emit('FALSE')
+        elif isinstance(value, str):
+            self.string(value)
+        elif isinstance(value, Number):
+            self.emit(value.text)
+        elif isinstance(value, int):
+            self.emit(str(value))
+        elif isinstance(value, float) and value == value and abs(value) != float('inf'):
+            self.emit(repr(value))
+        else:
+            raise ValueError(f'literal {value!r} can not be written')
+
+    def string(self, value):
+        if "'" not in value:
+            self.emit(f"'{value}'")
+        elif '"' not in value:
+            self.emit(f'"{value}"')
+        else:
+            raise ValueError(f'string {value!r} can not be quoted')
+
+    def parameter(self, parameter):
+        if isinstance(parameter.name, int):
+            self.emit(f'?{parameter.name}')
+        else:
+            self.emit(parameter.name)
+
+    def keyword(self, word):
+        self.emit(word.upper())
+
+    def statements(self, statements):
+        for index, statement in enumerate(statements):
+            if index:
+                self.emit(';' if self.minify else '; ')
+            self.node(statement)
+
+    def with_clause(self, node):
+        if node is not None:
+            self.emit('WITH ')
+            self.sequence(node.ctes, self.cte)
+            self.emit(' ')
+
+    def cte(self, cte):
+        self.identifier(cte.name)
+
+        if cte.columns:
+            self.parenthesized(cte.columns, self.identifier)
+
+        self.emit(' AS ')
+
+        if cte.materialized is not None:
+            self.emit('MATERIALIZED ' if cte.materialized else 'NOT MATERIALIZED ')
+
+        self.subquery(cte.select)
+
+    def subquery(self, node):
+        self.emit('(')
+        self.node(node)
+        self.emit(')')
+
+    def select(self, select):
+        self.with_clause(getattr(select, 'with_clause', None))
+        self.node(select.select_core)
+
+        if getattr(select, 'order_by', None):
+            self.emit(' ORDER BY ')
+            self.sequence(select.order_by, self.ordering_term)
+
+        if getattr(select, 'limit', None):
+            count, offset = select.limit
+            self.emit(' LIMIT ')
+            self.node(count)
+
+            if offset != 0:
+                self.emit(' OFFSET ')
+                self.node(offset)
+
+    def ordering_term(self, term):
+        expression, direction, nulls = term
+        self.node(expression)
+
+        if direction is not None:
+            self.emit(f' {direction}')
+
+        if nulls is not None:
+            self.emit(f' NULLS {nulls}')
+
+    def select_core(self, core):
+        self.emit('SELECT ')
+
+        if getattr(core, 'reduction', None):
+            self.emit(f'{core.reduction} ')
+
+        self.sequence(core.result_column_list)
+
+        if getattr(core, 'table_list', None):
+            self.emit(' FROM ')
+            self.sequence(core.table_list, self.source)
+
+        if getattr(core, 'where', None) is not None:
+            self.emit(' WHERE ')
+            self.node(core.where)
+
+        if getattr(core, 'group', None):
+            self.emit(' GROUP BY ')
+            self.sequence(core.group)
+
+        if getattr(core, 'having', None) is not None:
+            self.emit(' HAVING ')
+            self.node(core.having)
+
+    def values(self, values):
+        self.emit('VALUES ')
+        self.sequence(values.values, self.parenthesized)
+
+    def columnar_values(self, values):
+        self.emit('VALUES ')
+        self.sequence(zip(*values.columns), self.parenthesized)
+
+    def insert(self, insert):
+        self.with_clause(insert.with_clause)
+
+        if isinstance(insert, Replace):
+            self.emit('REPLACE')
+        else:
+            self.emit('INSERT')
+
+            if insert.alternative is not None:
+                self.emit(f' OR {insert.alternative.upper()}')
+
+        self.emit(' INTO ')
+        self.node(insert.target)
+
+        if insert.columns and not isinstance(insert.columns[0], All):
+            self.emit(' ')
+            self.parenthesized(insert.columns, self.identifier)
+
+        if insert.values is None:
+            self.emit(' DEFAULT VALUES')
+        else:
+            self.emit(' ')
+            self.node(insert.values)
+
+        self.returning(insert.returns)
+
+    def returning(self, columns):
+        if columns:
+            self.emit(' RETURNING ')
+            self.sequence(columns)
+
+    def update(self, update):
+        self.with_clause(update.with_clause)
+        self.emit('UPDATE ')
+
+        if update.alternative is not None:
+            self.emit(f'OR {update.alternative.upper()} ')
+
+        self.node(update.target)
+        self.emit(' SET ')
+        self.sequence(update.assignments, self.assignment)
+
+        if update.tables:
+            self.emit(' FROM ')
+            self.sequence(update.tables, self.source)
+
+        if update.where is not None:
+            self.emit(' WHERE ')
+            self.node(update.where)
+
+        self.returning(update.returns)
+
+    def assignment(self, assignment):
+        columns, value = assignment
+
+        if len(columns) == 1:
+            self.identifier(columns[0])
+        else:
+            self.parenthesized(columns, self.identifier)
+
+        self.emit('=' if self.minify else ' = ')
+        self.node(value)
+
+    def delete(self, delete):
+        self.with_clause(delete.with_clause)
+        self.emit('DELETE FROM ')
+        self.node(delete.target)
+
+        if delete.where is not None:
+            self.emit(' WHERE ')
+            self.node(delete.where)
+
+        self.returning(delete.returns)
+
+    def create(self, create):
+        self.emit('CREATE TABLE ')
+        self.table(create.table)
+
+        if create.select is not None:
+            self.emit(' AS ')
+            self.node(create.select)
+        else:
+            self.emit(' ')
+            self.parenthesized(create.columns.items(), self.column_definition)
+
+    def column_definition(self, definition):
+        name, (kind, constraints) = definition
+        self.identifier(name)
+
+        if kind is not None:
+            self.emit(f' {kind.upper()}')
+
+        for constraint_name, constraint in constraints:
+            if constraint_name is not None:
+                self.emit(' CONSTRAINT ')
+                self.identifier(constraint_name)
+
+            self.emit(' PRIMARY KEY')
+
+            if constraint['order'] is not None:
+                self.emit(f" {constraint['order']}")
+
+            if constraint['on_conflict'] is not None:
+                self.emit(f" ON CONFLICT {constraint['on_conflict'].upper()}")
+
+            if constraint['autoincrement']:
+                self.emit(' AUTOINCREMENT')
+
+    def drop(self, drop):
+        self.emit('DROP TABLE IF EXISTS ' if drop.if_exists else 'DROP TABLE ')
+        self.table(drop.table)
+
+    def table(self, table):
+        if table.schema_name is not None:
+            self.identifier(table.schema_name)
+            self.emit('.')
+
+        self.identifier(table.name)
+
+    def index(self, index):
+        self.node(index.table)
+        self.emit(' INDEXED BY ')
+        self.identifier(index.name)
+
+    def alias(self, alias):
+        original = alias.original
+
+        if isinstance(original, Index):
+            self.node(original.table)
+        else:
+            self.source(original)
+
+        self.emit(' AS ')
+        self.identifier(alias.replacement)
+
+        if isinstance(original, Index):
+            self.emit(' INDEXED BY ')
+            self.identifier(original.name)
+
+    def query(self, node):
+        return (isinstance(node, Statement) or
+                (isinstance(node, Operation) and node.operator[0] in ('UNION', 'INTERSECT', 'EXCEPT')))
+
+    def column(self, column):
+        if column.table is not None:
+            self.table(column.table)
+            self.emit('.')
+
+        self.identifier(column.name)
+
+    def all(self, node):
+        if node.table is not None:
+            self.table(node.table)
+            self.emit('.')
+
+        self.emit('*')
+
+    def operand(self, node, bound=9, left=True):
+        if isinstance(node, Statement) or self.query(node):
+            self.subquery(node)
+        elif level(node) < bound or (not left and level(node) == bound):
+            self.emit('(')
+            self.node(node)
+            self.emit(')')
+        else:
+            self.node(node)
+
+    def source(self, node):
+        if self.query(node):
+            self.subquery(node)
+        else:
+            self.node(node)
+
+    def operation(self, operation):
+        operator, a, b = operation
+        head = operator[0]
+
+        if head in ('UNION', 'INTERSECT', 'EXCEPT'):
+            self.node(a)
+            self.emit(f" {' '.join(operator)} ")
+            self.node(b)
+        elif head == 'JOIN':
+            self.join(operation)
+        elif head == 'CALL':
+            self.call(a, b)
+        elif head == 'CAST':
+            self.emit('CAST(')
+            self.node(a)
+            self.emit(f' AS {kinds[b]})')
+        elif head == 'COLLATE':
+            self.operand(a, 7)
+            self.emit(' COLLATE ')
+            self.identifier(b)
+        elif head == 'EXISTS':
+            self.emit('EXISTS ')
+            self.subquery(b)
+        elif head == 'NOT' and a is None:
+            self.emit('NOT ')
+            self.operand(b, 3)
+        elif head == 'MINUS' and a is None:
+            self.emit('-')
+            self.operand(b, 8)
+        elif operator[-1] == 'IN':
+            self.operand(a, 4)
+            self.emit(f" {' '.join(operator)} ")
+            if isinstance(b, tuple) and not isinstance(b, Operation):
+                self.parenthesized(b)
+            else:
+                self.subquery(b)
+        elif head == 'IS':
+            self.operand(a, 4)
+            self.emit(f" {' '.join(operator)} NULL")
+        else:
+            bound = level(operation)
+            first, links = chain(operation)
+            self.operand(first, bound)
+
+            for operator, b in links:
+                self.binary(operator)
+                self.operand(b, bound, False)
+
+    def binary(self, operator):
+        operator = ' '.join(operator)
+
+        if self.minify and operator in symbols and operator not in ('+', '-'):
+            self.emit(operator)
+        else:
+            self.emit(f' {operator} ')
+
+    def join(self, operation):
+        operator, a, b = operation
+        *modifiers, constraint = operator[1:]
+
+        self.source(a)
+
+        for modifier in modifiers:
+            self.emit(f' {modifier}')
+
+        self.emit(' JOIN ')
+        self.source(b)
+
+        if constraint is not None:
+            kind, value = constraint
+
+            if kind == 'ON':
+                self.emit(' ON ')
+                self.node(value)
+            else:
+                self.emit(' USING ')
+                self.parenthesized(value, self.identifier)
+
+    def call(self, name, parameter):
+        if 'filter' not in parameter and name.upper() in functions:
+            return self.keyword(name)
+
+        self.emit(name)
+        self.emit('(')
+
+        if parameter['distinct']:
+            self.emit('DISTINCT ')
+
+        if isinstance(parameter['arguments'], All):
+            self.emit('*')
+        else:
+            self.sequence(parameter['arguments'])
+
+        if parameter['order_by']:
+            self.emit(' ORDER BY ')
+            self.sequence(parameter['order_by'], self.ordering_term)
+
+        self.emit(')')
+
+        if parameter.get('filter') is not None:
+            self.emit(' FILTER (WHERE ')
+            self.node(parameter['filter'])
+            self.emit(')')
+
+    dispatch = {Select: 'select',
+                SelectCore: 'select_core',
+                Values: 'values',
+                ColumnarValues: 'columnar_values',
+                Insert: 'insert',
+                Replace: 'insert',
+                Update: 'update',
+                Delete: 'delete',
+                Create: 'create',
+                Drop: 'drop',
+                Table: 'table',
+                Index: 'index',
+                Alias: 'alias',
+                Column: 'column',
+                All: 'all',
+                Operation: 'operation',
+                Parameter: 'parameter'}
+
+
+def unparse(node, minify=False):
+    writer = Writer(minify)
+
+    if isinstance(node, tuple) and node and all(isinstance(item, Statement) for item in node):
+        writer.statements(node)
+    else:
+        writer.node(node)
+
+    return writer.text()
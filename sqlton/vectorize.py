@@ -0,0 +1,245 @@
+import operator
+from sqlton.ast import Operation, Column, Parameter
+from sqlton.number import Number
+from sqlton.evaluate import comparisons, cached, operands
+
+numpy = None
+
+arithmetic = {'+': operator.add,
+              '-': operator.sub,
+              '*': operator.mul}
+
+
+def nullable(column):
+    if isinstance(column, numpy.ma.MaskedArray):
+        return numpy.ma.getdata(column), numpy.ma.getmaskarray(column)
+
+    column = numpy.asarray(column)
+
+    if column.dtype != object:
+        return column, numpy.False_
+
+    nulls = numpy.equal(column, None)
+
+    if not nulls.any():
+        return numpy.asarray(column.tolist()), numpy.False_
+
+    filled = column.copy()
+    filled[nulls] = type(column[~nulls][0])() if not nulls.all() else 0
+    return numpy.asarray(filled.tolist()), nulls
+
+
+def lookup(node):
+    name = node.name
+    qualified = None if node.table is None else f'{node.table.name}.{name}'
+
+    def evaluate(batch):
+        if qualified is not None and qualified in batch:
+            return nullable(batch[qualified])
+        return nullable(batch[name])
+
+    return evaluate
+
+
+def literal(value):
+    if value is None:
+        return lambda batch: (numpy.False_, numpy.True_)
+
+    return lambda batch: (value, numpy.False_)
+
+
+def boolean(values):
+    return numpy.asarray(values).astype(bool, copy=False)
+
+
+def truth(values, nulls):
+    values = boolean(values)
+    return values & ~nulls, ~values & ~nulls
+
+
+def binary(apply, a, b):
+    def evaluate(batch):
+        left, left_nulls = a(batch)
+        right, right_nulls = b(batch)
+        return apply(left, right), left_nulls | right_nulls
+
+    return evaluate
+
+
+def divide(left, right, nulls):
+    zero = right == 0
+    right = numpy.where(zero, 1, right)
+
+    if numpy.issubdtype(numpy.result_type(left), numpy.integer) \
+       and numpy.issubdtype(numpy.result_type(right), numpy.integer):
+        quotient = numpy.abs(left) // numpy.abs(right)
+        values = numpy.where((left < 0) == (right < 0), quotient, -quotient)
+    else:
+        values = numpy.true_divide(left, right)
+
+    return values, nulls | zero
+
+
+def division(a, b):
+    def evaluate(batch):
+        left, left_nulls = a(batch)
+        right, right_nulls = b(batch)
+        return divide(left, right, left_nulls | right_nulls)
+
+    return evaluate
+
+
+def conjunction(terms):
+    first, *rest = terms
+
+    def evaluate(batch):
+        true, false = truth(*first(batch))
+        for term in rest:
+            term_true, term_false = truth(*term(batch))
+            true = true & term_true
+            false = false | term_false
+        return true, ~(true | false)
+
+    return evaluate
+
+
+def disjunction(terms):
+    first, *rest = terms
+
+    def evaluate(batch):
+        true, false = truth(*first(batch))
+        for term in rest:
+            term_true, term_false = truth(*term(batch))
+            true = true | term_true
+            false = false & term_false
+        return true, ~(true | false)
+
+    return evaluate
+
+
+def negation(a):
+    def evaluate(batch):
+        values, nulls = a(batch)
+        return ~boolean(values), nulls
+
+    return evaluate
+
+
+def negative(a):
+    def evaluate(batch):
+        values, nulls = a(batch)
+        return -values, nulls
+
+    return evaluate
+
+
+def null_test(a, negated):
+    def evaluate(batch):
+        _, nulls = a(batch)
+        return (~nulls if negated else nulls | numpy.False_), numpy.False_
+
+    return evaluate
+
+
+def membership(a, nodes, negated):
+    if all(not isinstance(node, (Operation, Column, Parameter)) for node in nodes):
+        values = [node.value if isinstance(node, Number) else node for node in nodes]
+        unknown = None in values
+        values = [value for value in values if value is not None]
+
+        def evaluate(batch):
+            left, nulls = a(batch)
+            found = numpy.isin(left, values)
+            if unknown:
+                nulls = nulls | ~found
+            return found != negated, nulls
+
+        return evaluate
+
+    items = [build(node) for node in nodes]
+
+    def evaluate(batch):
+        left, left_nulls = a(batch)
+        found, unknown = numpy.False_, numpy.False_
+        for item in items:
+            right, right_nulls = item(batch)
+            found = found | ((left == right) & ~right_nulls)
+            unknown = unknown | right_nulls
+        return found != negated, left_nulls | (unknown & ~found)
+
+    return evaluate
+
+
+def build(node):
+    if isinstance(node, Column):
+        return lookup(node)
+
+    if isinstance(node, Parameter):
+        raise ValueError(f'unbound parameter {node.name!r}, bind it before compiling')
+
+    if isinstance(node, Number):
+        return literal(node.value)
+
+    if not isinstance(node, Operation):
+        if node is None or isinstance(node, (bool, int, float, str, bytes)):
+            return literal(node)
+
+        raise ValueError(f'cannot vectorize {type(node).__name__}')
+
+    name = node.operator[-1]
+
+    if name in comparisons:
+        return binary(comparisons[name], build(node.a), build(node.b))
+
+    if name in arithmetic:
+        return binary(arithmetic[name], build(node.a), build(node.b))
+
+    if name == '/':
+        return division(build(node.a), build(node.b))
+
+    if name == 'AND':
+        return conjunction([build(term) for term in operands(node, 'AND')])
+
+    if name == 'OR':
+        return disjunction([build(term) for term in operands(node, 'OR')])
+
+    if node.operator == ('NOT',):
+        return negation(build(node.b))
+
+    if node.operator == ('MINUS',):
+        return negative(build(node.b))
+
+    if node.operator in (('IS',), ('IS', 'NOT')):
+        return null_test(build(node.a), name == 'NOT')
+
+    if name == 'IN':
+        if type(node.b) is not tuple:
+            raise ValueError('cannot vectorize subquery')
+
+        return membership(build(node.a), node.b, node.operator[0] == 'NOT')
+
+    raise ValueError(f"cannot vectorize operator {' '.join(node.operator)}")
+
+
+def load():
+    global numpy
+
+    if numpy is None:
+        import numpy
+
+    return numpy
+
+
+def vectorizer(expression):
+    try:
+        load()
+    except ImportError:
+        raise ImportError('sqlton.vectorize requires numpy') from None
+
+    return cached('vector', expression, lambda: build(expression))
+
+
+def mask(expression, batch):
+    values, nulls = vectorizer(expression)(batch)
+    length = len(next(iter(batch.values()))) if batch else 1
+    return numpy.broadcast_to(boolean(values) & ~nulls, (length,))
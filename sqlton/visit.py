@@ -0,0 +1,135 @@
+PRUNE = object()
+
+leaves = frozenset((str, int, float, bool, bytes, type(None), type))
+
+
+def children(node):
+    if type(node) in leaves:
+        return ()
+
+    if isinstance(node, tuple):
+        return node
+
+    if isinstance(node, dict):
+        return tuple(node.values())
+
+    if hasattr(node, '_asdict'):
+        return tuple(node._asdict().values())
+
+    return ()
+
+
+def rebuild(node, items):
+    if isinstance(node, tuple):
+        return type(node)._make(items) if hasattr(node, '_fields') else tuple(items)
+
+    if isinstance(node, dict):
+        return dict(zip(node.keys(), items))
+
+    return type(node)(**dict(zip(node._asdict().keys(), items)))
+
+
+def walk(node, prune=None):
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
+        yield node
+
+        if prune is None or not prune(node):
+            stack.extend(reversed(children(node)))
+
+
+def rewrite(node, enter=None, leave=None):
+    stack = [(node, None)]
+    results = []
+
+    while stack:
+        node, items = stack.pop()
+
+        if items is not None:
+            rebuilt = results[-len(items):]
+            del results[-len(items):]
+
+            if any(new is not old for new, old in zip(rebuilt, items)):
+                node = rebuild(node, rebuilt)
+
+            results.append(node if leave is None else leave(node))
+            continue
+
+        if enter is not None:
+            entered = enter(node)
+
+            if entered is PRUNE:
+                results.append(node)
+                continue
+
+            if entered is not node:
+                results.append(entered)
+                continue
+
+        items = children(node)
+
+        if not items:
+            results.append(node if leave is None else leave(node))
+            continue
+
+        stack.append((node, items))
+        stack.extend((item, None) for item in reversed(items))
+
+    return results[0]
+
+
+class Dispatcher:
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls._methods = {}
+
+    @classmethod
+    def _lookup(cls, kind, prefix):
+        try:
+            return cls._methods[prefix, kind]
+        except KeyError:
+            pass
+
+        method = None
+        for base in kind.__mro__:
+            method = getattr(cls, f'{prefix}_{base.__name__}', None)
+            if method is not None:
+                break
+
+        cls._methods[prefix, kind] = method
+        return method
+
+
+class Visitor(Dispatcher):
+    def visit(self, node):
+        lookup = self._lookup
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+            method = lookup(type(node), 'visit')
+
+            if method is not None and method(self, node) is PRUNE:
+                continue
+
+            stack.extend(reversed(children(node)))
+
+
+class Transformer(Dispatcher):
+    def transform(self, node):
+        return rewrite(node, self.__enter, self.__leave)
+
+    def __enter(self, node):
+        method = self._lookup(type(node), 'enter')
+
+        if method is None:
+            return node
+
+        result = method(self, node)
+        return node if result is None else result
+
+    def __leave(self, node):
+        method = self._lookup(type(node), 'transform')
+        return node if method is None else method(self, node)
@@ -12,4 +12,26 @@ def all():
     execute_tests('tests.test_create_drop')
     execute_tests('tests.test_insert')
     execute_tests('tests.test_select')
+    execute_tests('tests.test_ast')
+    execute_tests('tests.test_parameter')
+    execute_tests('tests.test_errors')
+    execute_tests('tests.test_positions')
+    execute_tests('tests.test_unparse')
+    execute_tests('tests.test_fingerprint')
+    execute_tests('tests.test_visit')
+    execute_tests('tests.test_analysis')
+    execute_tests('tests.test_interning')
+    execute_tests('tests.test_evaluate')
+    execute_tests('tests.test_vectorize')
+    execute_tests('tests.test_execute')
+    execute_tests('tests.test_pool')
+    execute_tests('tests.test_aio')
+    execute_tests('tests.test_bulk')
+    execute_tests('tests.test_cache')
+    execute_tests('tests.test_tables')
+    execute_tests('tests.test_lexer')
+    execute_tests('tests.test_stream')
+    execute_tests('tests.test_classify')
+    execute_tests('tests.test_document')
+    execute_tests('tests.test_batch')
     execute_tests('tests.test_expression')
@@ -0,0 +1,45 @@
+from io import StringIO
+from contextlib import redirect_stderr
+from asyncio import run, gather
+from concurrent.futures import ThreadPoolExecutor
+from sqlton.aio import parse_async
+from sqlton.ast import Select, Insert
+
+
+def test_parse_async_inline():
+    blocked = []
+
+    async def main():
+        return await parse_async('select * from t', on_block=blocked.append)
+
+    ast, = run(main())
+
+    assert isinstance(ast, Select)
+    assert len(blocked) == 1
+
+
+def test_parse_async_offload():
+    blocked = []
+    large = 'insert into t (a) values ' + ', '.join(f'({index})' for index in range(2000))
+
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            return await gather(*(parse_async(large, executor, 1024, blocked.append)
+                                  for _ in range(5)),
+                                parse_async('select 1', executor, 1024, blocked.append))
+
+    results = run(main())
+
+    assert all(isinstance(result[0], Insert) for result in results[:5])
+    assert len(results[0][0].values.values) == 2000
+    assert len(blocked) == 1
+
+
+def test_parse_async_error():
+    async def main():
+        return await parse_async('select # from t', inline_threshold=0)
+
+    with redirect_stderr(StringIO()) as output:
+        assert run(main()) is None
+
+    assert 'illegal character' in output.getvalue()
@@ -0,0 +1,51 @@
+from sqlton import parse
+from sqlton.analysis import dependencies, analyze
+from sqlton.ast import Table, Column
+
+
+def test_dependencies_insert():
+    result = dependencies('with c as (select * from a) '
+                          'insert into s.t (x, y) '
+                          'select c.x, b.y from c join b on b.id = c.id '
+                          'where b.z in (select z from d)')
+
+    assert result.reads == {Table('a'), Table('b'), Table('d')}
+    assert result.writes == {Table('t', 's')}
+    assert Column('x', Table('t', 's')) in result.columns
+    assert Column('id', Table('b')) in result.columns
+    assert Column('z') in result.columns
+
+
+def test_dependencies_statements():
+    assert dependencies('update t set a = b where c = 1').writes == {Table('t')}
+    assert dependencies('delete from t where a in (select a from u)').reads == {Table('u')}
+    assert dependencies('drop table if exists s.t').writes == {Table('t', 's')}
+    assert dependencies('create table t as select * from u').reads == {Table('u')}
+    assert dependencies('select * from t as x, (select 1 from u) as q').reads == {Table('t'), Table('u')}
+
+    script = dependencies('select * from a; insert into b values (1)')
+    assert (script.reads, script.writes) == ({Table('a')}, {Table('b')})
+
+
+def test_dependencies_cte_scope():
+    nested = dependencies('select * from t where a in (with t as (select a from u) select a from t)')
+    assert nested.reads == {Table('t'), Table('u')}
+
+    derived = dependencies('select * from (with t as (select 1) select * from t) as q, t')
+    assert derived.reads == {Table('t')}
+
+
+def test_dependencies_memoized():
+    statement, = parse('select a from t')
+
+    assert dependencies(statement) is dependencies(statement)
+    assert dependencies('select * from t where a = 1') is dependencies('select * from t where a = 2')
+
+
+def test_dependencies_statement_memo():
+    statement, = parse('select a from t')
+    assert dependencies(statement) is dependencies(statement)
+
+    statement.select_core.table_list = (Table('u'),)
+    assert analyze(statement).reads == {Table('u')}
+    assert dependencies(parse('select a from t')[0]).reads == {Table('t')}
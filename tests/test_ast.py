@@ -0,0 +1,33 @@
+from sqlton import parse
+from sqlton.ast import Select, SelectCore, Column, substitute
+
+
+def test_slots():
+    ast, = parse('select a from t')
+
+    assert not hasattr(ast, '__dict__')
+    assert not hasattr(ast, 'limit')
+    assert hasattr(parse('select a from t limit 1')[0], 'limit')
+
+    try:
+        Select(unknown=None)
+    except AttributeError:
+        pass
+    else:
+        assert False, 'undeclared field accepted'
+
+
+def test_asdict():
+    ast, = parse('select a from t where b = 1')
+
+    assert list(ast.select_core._asdict()) == ['reduction', 'result_column_list', 'table_list', 'where']
+
+
+def test_substitute():
+    ast, = parse('select a from t where b = 1')
+    renamed = substitute(ast, Column, lambda column: Column(column.name.upper(), column.table))
+
+    assert renamed.select_core.result_column_list == (Column('A'),)
+    assert renamed.select_core.where.a == Column('B')
+    assert ast.select_core.where.a == Column('b')
+    print(renamed)
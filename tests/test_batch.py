@@ -0,0 +1,39 @@
+from unittest import mock
+from sqlton import batch
+from sqlton.batch import parse_many
+from sqlton.ast import Select, Insert
+from sqlton.errors import SqltonSyntaxError
+
+
+def test_parse_many():
+    statements = ['select * from t', 'insert into t (a) values (1)'] * 10
+    results = list(parse_many(statements, workers=2, chunksize=3))
+
+    assert [result.index for result in results] == list(range(20))
+    assert all(result.error is None for result in results)
+    assert isinstance(results[0].ast[0], Select)
+    assert isinstance(results[1].ast[0], Insert)
+
+
+def test_parse_many_unordered():
+    results = list(parse_many((f'select {index}' for index in range(50)),
+                              workers=2, chunksize=4, ordered=False))
+
+    assert sorted(result.index for result in results) == list(range(50))
+
+
+def test_parse_many_errors():
+    results = list(parse_many(['select * from t', 'select # from t', 'drop table t'], workers=1))
+
+    assert results[0].error is None
+    assert results[1].ast is None
+    assert isinstance(results[1].error, SqltonSyntaxError)
+    assert results[1].error.index == 7
+    assert results[2].error is None
+
+
+def test_parse_many_unknown_cpu_count():
+    with mock.patch.object(batch, 'cpu_count', lambda: None):
+        results = list(parse_many(['select 1', 'select 2']))
+
+    assert [result.index for result in results] == [0, 1]
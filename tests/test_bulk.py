@@ -0,0 +1,49 @@
+from array import array
+from sqlton import parse, unparse
+from sqlton.bulk import parse_insert
+from sqlton.ast import Insert, Values, ColumnarValues, Column
+
+
+def test_bulk_columns():
+    statement, = parse_insert("insert into t (a, b, c, d) values "
+                              "(1, 'x', 2.5, null), (+2, \"y\", 3.5, true), (-3, 'z', .5, FALSE)")
+
+    assert isinstance(statement, Insert)
+    assert statement.columns == ('a', 'b', 'c', 'd')
+    assert statement.values == ColumnarValues((array('q', [1, 2, -3]),
+                                               ['x', 'y', 'z'],
+                                               array('d', [2.5, 3.5, 0.5]),
+                                               [None, True, False]))
+
+
+def test_bulk_matches_grammar():
+    text = "replace into s.t (a, b) values (1, 'one'), (2, 'two') returning a"
+    statement, = parse_insert(text)
+    reference, = parse(text)
+
+    assert statement.target == reference.target
+    assert statement.returns == reference.returns
+    assert tuple(zip(*statement.values.columns)) == reference.values.values
+    assert unparse(statement) == unparse(reference)
+
+
+def test_bulk_fallback():
+    statement, = parse_insert('insert into t values (1, 2), (a, 3)')
+    assert statement.values == Values(((1, 2), (Column('a'), 3)))
+
+    statement, = parse_insert('insert into t values (1), (2, 3)')
+    assert statement.values == Values(((1,), (2, 3)))
+
+    statement, = parse_insert('insert into t select 1')
+    assert not isinstance(statement.values, ColumnarValues)
+
+    assert parse_insert("insert into t values (1, 'it''s')") is None
+
+
+def test_bulk_trailing_statements():
+    text = 'with x as (values (1)) insert into t values (5), (6); select 1'
+    statements = parse_insert(text)
+
+    assert len(statements) == 2
+    assert statements[0].values == ColumnarValues((array('q', [5, 6]),))
+    assert unparse(statements[1]) == 'SELECT 1'
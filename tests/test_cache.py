@@ -0,0 +1,58 @@
+from sqlton import parse, ParseCache
+from sqlton.ast import Select
+
+
+def test_cache_hit():
+    cache = ParseCache()
+    first, = cache.parse('select * from person where age > 18 and name like "A%"')
+    second, = cache.parse('select * from person where age > 21 and name like "B%"')
+
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+
+    assert isinstance(second, Select)
+    assert second.select_core.where.a.b == 21
+    assert second.select_core.where.b.b == 'B%'
+    assert first.select_core.where.a.b == 18
+    assert repr(second) == repr(parse('select * from person where age > 21 and name like "B%"')[0])
+    print(second)
+
+
+def test_cache_identifiers():
+    cache = ParseCache()
+    cache.parse('select a from t')
+    cache.parse('select b from t')
+
+    assert cache.cache_info().misses == 2
+
+
+def test_cache_keyword_case():
+    cache = ParseCache()
+    cache.parse('select a from t where b = true')
+    statement, = cache.parse('SELECT a FROM t WHERE b = true')
+    cache.parse('Select a From t Where b = false')
+    cache.parse('select a from t where b <> 1')
+    cache.parse('select a from t where b != 1')
+
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 4
+    assert repr(statement) == repr(parse('select a from t where b = true')[0])
+
+
+def test_cache_eviction():
+    cache = ParseCache(maxsize=2)
+    for table in ('a', 'b', 'c'):
+        cache.parse(f'select * from {table} limit 1')
+
+    info = cache.cache_info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+
+
+def test_cache_insert_values():
+    cache = ParseCache()
+    cache.parse('insert into t (a, b) values (1, "x")')
+    ast, = cache.parse('insert into t (a, b) values (2, "y")')
+
+    assert ast.values.values == ((2, 'y'),)
+    print(ast)
@@ -0,0 +1,46 @@
+from sqlton import parse
+from sqlton.classify import classify, split
+from sqlton.ast import Select, Insert, Replace, Update, Delete, Create, Drop
+from sqlton.errors import SqltonSyntaxError
+
+script = ("with a as (select ';(' from t), b as (select 2) delete from t where id in (select * from a);\n"
+          "insert or replace into t values (1, \"x;\");\n"
+          "replace into t values (2);\n"
+          "values (1), (2);\n"
+          "select `odd;name` from t union select 1;\n"
+          "create table u (a integer);\n"
+          "update t set a = 1 where b in (select b from u);\n"
+          "drop table if exists u\n")
+
+
+def test_classify_statements():
+    assert classify(script) == (Delete, Insert, Replace, Select, Select, Create, Update, Drop)
+    assert classify(script) == tuple(map(type, parse(script)))
+    assert classify('') == classify(' ; ') == ()
+
+
+def test_classify_against_parse():
+    for text in ('select * from orders where status = "open" order by created desc limit 20',
+                 'with recursive c (n) as (select 1 union all select n + 1 from c) select * from c',
+                 'with c as materialized (select id from person) update person set a = 1 where id in (select id from c)',
+                 'insert into audit (person_id, action) values (1, "login")',
+                 'delete from session where token = "a;b"'):
+        assert classify(text) == tuple(map(type, parse(text)))
+
+
+def test_split_statements():
+    pieces = split(script)
+
+    assert len(pieces) == 8
+    assert pieces[0].endswith('in (select * from a)')
+    assert pieces[-1] == 'drop table if exists u'
+    assert [type(parse(piece)[0]) for piece in pieces] == list(classify(script))
+
+
+def test_split_unterminated():
+    try:
+        split("select 'open")
+    except SqltonSyntaxError as error:
+        assert error.index == 7
+    else:
+        assert False
@@ -0,0 +1,61 @@
+from sqlton.document import Document
+from sqlton.ast import Select, Insert
+
+
+def test_document_parse():
+    document = Document('select a from t; insert into t values (1);\n select b from u;')
+
+    assert [type(statement) for statement in document.statements] == [Select, Insert, Select]
+    assert document.spans == ((0, 15), (16, 41), (42, 59))
+
+
+def test_document_edit():
+    document = Document('select a from t; select b from u; select c from v')
+    first, second, third = document.statements
+
+    start = document.text.index('b')
+    assert document.apply_edit((start, start + 1), 'bb') == [1]
+
+    statements = document.statements
+    assert statements[0] is first
+    assert statements[1] is not second
+    assert statements[2] is third
+    assert statements[1].select_core.result_column_list[0].name == 'bb'
+    assert document.text == 'select a from t; select bb from u; select c from v'
+
+
+def test_document_split_and_merge():
+    document = Document('select a from t; select c from v')
+    first, second = document.statements
+
+    start = document.text.index(';') + 1
+    assert document.apply_edit((start, start), ' select b from u;') == [1, 2]
+    assert len(document.statements) == 3
+    assert document.statements[0] is first
+    assert document.statements[2] is second
+
+    start = document.text.index(';')
+    assert document.apply_edit((start, start + 1), '') == [0, 1]
+    assert len(document.statements) == 2
+    assert document.statements[1] is second
+
+
+def test_document_quotes():
+    document = Document("select 'a' from t; select b from u; select c from v")
+    last = document.statements[-1]
+
+    document.apply_edit((8, 8), "'")
+    assert len(document.statements) == 1
+
+    assert document.apply_edit((8, 9), '') == [0, 1, 2]
+    assert len(document.statements) == 3
+    assert document.statements[-1] is last
+
+
+def test_document_append():
+    document = Document('select a from t;')
+    first, = document.statements
+
+    assert document.apply_edit((16, 16), ' select b from u') == [1]
+    assert document.statements[0] is first
+    assert Document().statements == ()
@@ -0,0 +1,86 @@
+from io import StringIO
+from contextlib import redirect_stderr
+from pickle import dumps, loads
+from sqlton import parse, parse_script, ParseCache
+from sqlton.parser import Lexer, Parser
+from sqlton.errors import SqltonSyntaxError
+from sqlton.batch import parse_many
+from sqlton.ast import Select
+
+
+def raised(statement, **options):
+    try:
+        parse(statement, **options)
+    except SqltonSyntaxError as error:
+        return error
+
+
+def test_error_raise():
+    error = raised('select 1;\nselect from t', on_error='raise')
+
+    assert (error.token, error.value, error.index, error.lineno) == ('FROM', 'from', 17, 2)
+    assert 'IDENTIFIER' in error.expected
+    assert 'FROM' not in error.expected
+
+
+def test_error_end_of_input():
+    error = raised('select a from', on_error='raise')
+
+    assert error.token is None
+    assert error.message == 'unexpected end of input'
+    assert 'IDENTIFIER' in error.expected
+
+
+def test_error_illegal_character():
+    error = raised('select # from t', on_error='raise')
+
+    assert (error.token, error.value, error.index) == ('ERROR', '#', 7)
+    assert loads(dumps(error)).index == 7
+
+    with redirect_stderr(StringIO()) as output:
+        assert parse('select # from t') is None
+
+    assert "illegal character '#'" in output.getvalue()
+
+
+def test_error_print():
+    with redirect_stderr(StringIO()) as output:
+        assert parse('select from t') is None
+
+    assert 'unexpected FROM' in output.getvalue()
+
+
+def test_error_recover():
+    with redirect_stderr(StringIO()) as output:
+        statements, errors = parse_script('select 1; selec 2; select # from t; select 3; select')
+
+    assert [type(statement) for statement in statements] == [Select, type(None), type(None), Select, type(None)]
+    assert [error.token for error in errors] == ['IDENTIFIER', 'ERROR', None]
+    assert output.getvalue() == ''
+
+
+def test_error_recover_reset():
+    parser = Parser(on_error='recover')
+
+    parser.parse(Lexer(on_error='recover').tokenize('select from'))
+    assert len(parser.errors) == 1
+
+    parser.parse(Lexer(on_error='recover').tokenize('select 1'))
+    assert parser.errors == []
+
+
+def test_error_modes():
+    try:
+        Parser(on_error='ignore')
+    except ValueError:
+        pass
+    else:
+        assert False
+
+    assert ParseCache(on_error='recover').parse('select from; select 1')[1] is not None
+
+
+def test_error_batch_processes():
+    results = list(parse_many(['select 1', 'select from t'], workers=2))
+
+    assert results[1].error.token == 'FROM'
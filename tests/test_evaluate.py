@@ -0,0 +1,120 @@
+from sqlton import parse
+from sqlton.evaluate import evaluator, predicate
+
+row = {'a': 3, 'b': 'Hello', 'c': None, 't.a': 5}
+
+
+def where(expression):
+    ast, = parse(f'select * from t where {expression}')
+    return ast.select_core.where
+
+
+def value(expression):
+    return evaluator(where(expression))(row)
+
+
+def test_evaluate_comparisons():
+    assert value('a = 3') is True
+    assert value('a <> 3') is False
+    assert value('a between 1 and 4') is True
+    assert value('a not between 1 and 4') is False
+    assert value('a * 2 + 1 = 7') is True
+    assert value('7 / 2 = 3') is True
+    assert value('-7 / 2 = -3') is True
+    assert value('7.0 / 2 = 3.5') is True
+    assert value('cast(b as integer) = 0') is True
+    assert value('cast(a as text) = \'3\'') is True
+
+
+def test_evaluate_null_logic():
+    assert value('c = 1') is None
+    assert value('not c = 1') is None
+    assert value('c = 1 or a = 3') is True
+    assert value('c = 1 and a = 4') is False
+    assert value('c = 1 and a = 3') is None
+    assert value('a in (1, c)') is None
+    assert value('a not in (1, c)') is None
+    assert value('a in (3, c)') is True
+    assert value('c is null') is True
+    assert value('1 / 0 is null') is True
+    assert value('coalesce(c, 2) = 2') is True
+    assert predicate(where('c = 1'))(row) is False
+
+
+def test_evaluate_patterns():
+    assert value('b like \'he%\'') is True
+    assert value('b like \'H_llo\'') is True
+    assert value('b not like \'%z\'') is True
+    assert value('b glob \'H*\'') is True
+    assert value('b glob \'h*\'') is False
+    assert value('b glob \'[GH]ello\'') is True
+    assert value('b glob \'[A-J]*\'') is True
+    assert value('b glob \'[^A-J]*\'') is False
+    assert value('b glob \'H[-a]llo\'') is False
+    assert value('b regexp \'l+o$\'') is True
+    assert value('a like \'3%\'') is True
+    assert value('a glob \'[0-4]\'') is True
+    assert value('c like \'%\'') is None
+    assert value('length(b) = 5') is True
+    assert value('length(123) = 3') is True
+    assert value('length(c) is null') is True
+    assert value('b collate nocase = \'HELLO\'') is True
+
+
+def test_evaluate_columns():
+    assert value('t.a = 5') is True
+    assert value('x.a = 3') is True
+
+    try:
+        value('d = 1')
+    except KeyError:
+        pass
+    else:
+        assert False
+
+
+def test_evaluate_cached():
+    assert evaluator(where('a > 1')) is evaluator(where('a > 1'))
+    assert evaluator(where('a / 2 = 1')) is not evaluator(where('a / 2.0 = 1'))
+    assert predicate(where('a > 1')) is predicate(where('a > 1'))
+
+
+def test_evaluate_unsupported():
+    for expression in ('a in (select a from u)', 'a = ?', 'a match \'x\''):
+        try:
+            evaluator(where(expression))
+        except ValueError:
+            pass
+        else:
+            assert False
+
+
+def test_evaluate_compound_subquery():
+    try:
+        evaluator(where('a in (select a from u union select a from v)'))
+    except ValueError as error:
+        assert str(error) == 'cannot compile subquery'
+    else:
+        assert False
+
+
+def test_evaluate_coercion():
+    text = {'a': '3', 'b': '2.5x'}
+
+    assert evaluator(where('a + 1 > 3'))(text) is True
+    assert evaluator(where('a * b = 7.5'))(text) is True
+    assert value('lower(5) = \'5\'') is True
+    assert value('abs(\'-2\') = 2') is True
+    assert value('cast(\'3.0\' as numeric) = 3') is True
+    assert value('cast(\'2.5x\' as decimal) = 2.5') is True
+    assert value('cast(\'7abc\' as integer) = 7') is True
+
+
+def test_evaluate_deep_chain():
+    conjunction = where(' and '.join(f'a <> {index}' for index in range(2000)))
+    total = where(' + '.join('a' for _ in range(2000)) + ' = 6000')
+
+    assert predicate(conjunction)(row) is False
+    assert predicate(conjunction)({'a': -1}) is True
+    assert evaluator(total)(row) is True
+    assert evaluator(total)({'a': None}) is None
@@ -0,0 +1,110 @@
+from sys import executable
+from subprocess import check_output
+from itertools import count
+from os.path import join
+from tempfile import TemporaryDirectory
+from sqlton.execute import execute, read_csv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+people = [{'id': 1, 'name': 'ann', 'age': 30, 'team': 1},
+          {'id': 2, 'name': 'bob', 'age': None, 'team': 2},
+          {'id': 3, 'name': 'cid', 'age': 25, 'team': 1},
+          {'id': 4, 'name': 'dan', 'age': 41, 'team': None}]
+
+teams = [{'id': 1, 'title': 'red'},
+         {'id': 2, 'title': 'blue'},
+         {'id': 3, 'title': 'void'}]
+
+sources = {'people': people, 'teams': teams}
+
+
+def run(statement):
+    return list(execute(statement, sources))
+
+
+def test_execute_filter_and_project():
+    assert run('select name from people where age > 26') == [{'name': 'ann'}, {'name': 'dan'}]
+    assert run('select name, age + 1 as next from people limit 1') == [{'name': 'ann', 'next': 31}]
+    assert run('select * from people where age is null') == [people[1]]
+    assert run('select distinct team from people') == [{'team': 1}, {'team': 2}, {'team': None}]
+    assert run('select 1 + 1 as two') == [{'two': 2}]
+
+
+def test_execute_joins():
+    assert run('select p.name, t.title from people as p join teams as t on p.team = t.id') \
+        == [{'name': 'ann', 'title': 'red'}, {'name': 'bob', 'title': 'blue'}, {'name': 'cid', 'title': 'red'}]
+    assert run('select p.name, t.title from people as p left join teams as t on p.team = t.id')[-1] \
+        == {'name': 'dan', 'title': None}
+    assert run('select people.name from people, teams '
+               'where people.team = teams.id and teams.title = \'red\'') == [{'name': 'ann'}, {'name': 'cid'}]
+    assert [row['title'] for row in run('select * from people join teams using (id)')] == ['red', 'blue', 'void']
+
+
+def test_execute_aggregates():
+    assert run('select team, count(*) as n, avg(age) from people group by team order by n desc, team') \
+        == [{'team': 1, 'n': 2, 'avg(age)': 27.5},
+            {'team': None, 'n': 1, 'avg(age)': 41.0},
+            {'team': 2, 'n': 1, 'avg(age)': None}]
+    assert run('select count(*), sum(age), min(age), group_concat(name, \'-\') from people') \
+        == [{'count(*)': 4, 'sum(age)': 96, 'min(age)': 25, "group_concat(name, '-')": 'ann-bob-cid-dan'}]
+    assert run('select count(*) from people where age > 100') == [{'count(*)': 0}]
+    assert run('select team from people group by team having count(*) > 1') == [{'team': 1}]
+    assert run('select count(distinct team) from people') == [{'count(DISTINCT team)': 2}]
+    assert run('select t.title, count(p.id) as n from teams as t left join people as p on p.team = t.id '
+               'group by t.title order by t.title') \
+        == [{'title': 'blue', 'n': 1}, {'title': 'red', 'n': 2}, {'title': 'void', 'n': 0}]
+
+
+def test_execute_order_and_limit():
+    assert run('select name from people order by age desc limit 2') == [{'name': 'dan'}, {'name': 'ann'}]
+    assert run('select name from people order by age limit 2 offset 1') == [{'name': 'cid'}, {'name': 'ann'}]
+    assert run('select name from people order by age nulls last')[-1] == {'name': 'bob'}
+    assert list(execute('select n from t where n > 5 limit 3', {'t': ({'n': n} for n in count())})) \
+        == [{'n': 6}, {'n': 7}, {'n': 8}]
+
+
+def test_execute_compound_and_subqueries():
+    assert run('with old as (select * from people where age > 28) select name from old') \
+        == [{'name': 'ann'}, {'name': 'dan'}]
+    assert run('select q.name from (select name from people where age < 40) as q') \
+        == [{'name': 'ann'}, {'name': 'cid'}]
+    assert run('select team from people union select id from teams order by team') \
+        == [{'team': None}, {'team': 1}, {'team': 2}, {'team': 3}]
+    assert run('select id from teams except select team from people') == [{'id': 3}]
+    assert len(run('select name from people union all select title from teams')) == 7
+
+
+def test_execute_csv():
+    with TemporaryDirectory() as directory:
+        path = join(directory, 'scores.csv')
+
+        with open(path, 'w') as file:
+            file.write('id,name,score\n1,ann,2.5\n2,bob,\n3,cid,-4\n')
+
+        assert list(execute('select name, score from s where score < 3 order by score',
+                            {'s': read_csv(path)})) == [{'name': 'cid', 'score': -4},
+                                                        {'name': 'ann', 'score': 2.5}]
+
+
+def test_execute_batches():
+    if numpy is None:
+        return
+
+    batch = {'a': numpy.arange(10),
+             'b': numpy.ma.array(numpy.arange(10) * 1.5, mask=[n % 3 == 0 for n in range(10)])}
+
+    assert list(execute('select a, b from t where a > 5 and b is not null', {'t': [batch, batch]})) \
+        == [{'a': 7, 'b': 10.5}, {'a': 8, 'b': 12.0}] * 2
+    assert list(execute('select sum(a) from t', {'t': batch})) == [{'sum(a)': 45}]
+
+
+def test_execute_import_is_light():
+    check = ('import sys, sqlton; '
+             'print(sorted(set(sys.modules) & {"numpy", "asyncio", "multiprocessing"}))')
+    output = check_output((executable, '-c', check), text=True)
+
+    assert output.strip() == '[]'
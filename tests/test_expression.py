@@ -0,0 +1,53 @@
+from sqlton import parse
+from sqlton.ast import Operation, Column
+
+
+def where(expression):
+    ast, = parse(f'select * from t where {expression}')
+    return ast.select_core.where
+
+
+def test_arithmetic_precedence():
+    expression = where('a + 2 * 3 > 4')
+
+    assert expression == Operation(('>',),
+                                   Operation(('+',), Column('a'), Operation(('*',), 2, 3)),
+                                   4)
+
+
+def test_boolean_precedence():
+    expression = where('a = 1 or b = 2 and c = 3')
+
+    assert expression.operator == ('OR',)
+    assert expression.b.operator == ('AND',)
+
+
+def test_between():
+    assert where('a between 1 and 2') == Operation(('AND',),
+                                                   Operation(('>=',), Column('a'), 1),
+                                                   Operation(('<=',), Column('a'), 2))
+    assert where('a not between 1 and 2') == Operation(('OR',),
+                                                       Operation(('<',), Column('a'), 1),
+                                                       Operation(('>',), Column('a'), 2))
+
+
+def test_is_null():
+    expression = where('a is null and b is not null')
+
+    assert expression == Operation(('AND',),
+                                   Operation(('IS',), Column('a'), None),
+                                   Operation(('IS', 'NOT'), Column('b'), None))
+
+
+def test_in_list():
+    assert where('a not in (1, "b")') == Operation(('NOT', 'IN'), Column('a'), (1, 'b'))
+
+
+def test_like():
+    assert where('a not like "x%"') == Operation(('NOT', 'LIKE'), Column('a'), 'x%')
+
+
+def test_cast():
+    ast, = parse('select cast(a as integer), cast(a as real), cast(a as text) from t')
+
+    assert [column.b for column in ast.select_core.result_column_list] == [int, float, str]
@@ -0,0 +1,34 @@
+from sqlton import parse, fingerprint, token_fingerprint
+from sqlton.fingerprint import normalize, normalize_tokens
+
+
+def test_normalize():
+    assert (normalize('select a from t where b = 1 and c like "x%" and d is null') ==
+            'SELECT a FROM t WHERE b=? AND c LIKE ? AND d IS NULL')
+
+
+def test_fingerprint_literals():
+    assert (fingerprint('select a from t where b = 1 and c = "x"') ==
+            fingerprint('SELECT a\n  FROM t\n WHERE b = 42 AND c = \'y\''))
+    assert fingerprint('select a from t where b = 1') != fingerprint('select a from t where c = 1')
+
+
+def test_fingerprint_ast():
+    ast = parse('select a from t where b = ?')
+
+    assert fingerprint(ast) == fingerprint('select a from t where b = 3')
+    assert fingerprint(ast[0]) == fingerprint(ast)
+
+
+def test_fingerprint_tokens():
+    assert normalize_tokens('select a from t where b = 1') == 'SELECT a FROM t WHERE b EQUAL ?'
+    assert (token_fingerprint('select a from t where b <> 1') ==
+            token_fingerprint('SELECT a FROM t WHERE b != "z"'))
+    assert token_fingerprint('select a from t') != fingerprint('select a from t')
+
+
+def test_fingerprint_deep_chain():
+    chain = ' and '.join(f'(kind = {index} or source like "s{index}%")' for index in range(1000))
+    other = ' and '.join(f'(kind = {index + 1} or source like "t{index}%")' for index in range(1000))
+
+    assert fingerprint(f'select * from event where {chain}') == fingerprint(f'select * from event where {other}')
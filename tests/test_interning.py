@@ -0,0 +1,43 @@
+from sqlton.parser import Lexer, Parser
+from sqlton.pool import ParserPool
+from sqlton.analysis import analyze
+from sqlton.ast import Table
+
+
+def test_interning_shares_leaves():
+    pool = ParserPool(intern=True)
+    first, = pool.parse('select person.id, name from person where id = 1 and a + b > 2')
+    second, = pool.parse('select person.id from person where id = 2 and a + b > 3')
+
+    assert first.select_core.result_column_list[0] is second.select_core.result_column_list[0]
+    assert first.select_core.table_list[0] is second.select_core.table_list[0]
+    assert first.select_core.where.b.a.operator is second.select_core.where.b.a.operator
+    assert first.select_core.where.a.a is second.select_core.where.a.a
+
+
+def test_interning_keeps_kinds_apart():
+    statement, = ParserPool(intern=True).parse('select x from x')
+
+    assert type(statement.select_core.result_column_list[0]).__name__ == 'Column'
+    assert type(statement.select_core.table_list[0]) is Table
+
+
+def test_interning_identifiers():
+    lexer = Lexer()
+    first = [token.value for token in lexer.tokenize('select some_column from t')]
+    second = [token.value for token in lexer.tokenize('select ' + 'some_' + 'column from t')]
+
+    assert first[1] is second[1]
+
+
+def test_interning_statements():
+    statement, = ParserPool(intern=True).parse('insert into t select * from t')
+
+    assert analyze(statement).reads == {Table('t')}
+
+    try:
+        Parser(positions=True, intern=True)
+    except ValueError:
+        pass
+    else:
+        assert False
@@ -0,0 +1,74 @@
+from sqlton import parse, parse_insert, ParseCache
+from sqlton.parser import Lexer, Parser
+from sqlton.number import Number
+
+
+def tokens(text):
+    return [(token.type, token.value) for token in Lexer().tokenize(text)]
+
+
+def test_keyword_case():
+    assert tokens('Select sElEcT SELECT') == [('SELECT', 'Select'),
+                                             ('SELECT', 'sElEcT'),
+                                             ('SELECT', 'SELECT')]
+
+
+def test_keyword_prefix():
+    assert tokens('selected fromage current_timestamps') == [('IDENTIFIER', 'selected'),
+                                                             ('IDENTIFIER', 'fromage'),
+                                                             ('IDENTIFIER', 'current_timestamps')]
+
+
+def test_quoted_keyword():
+    assert tokens('`select`') == [('IDENTIFIER', 'select')]
+
+
+def test_keyword_literals():
+    assert tokens('true False null') == [('BOOLEAN_LITERAL', True),
+                                         ('BOOLEAN_LITERAL', False),
+                                         ('NULL_LITERAL', None)]
+
+
+def test_numeric_literals():
+    assert tokens('1e3 .5 0x10 0XfF 1.25e-2 42 99999999999999999999') == [
+        ('NUMERIC_LITERAL', 1000.0),
+        ('NUMERIC_LITERAL', 0.5),
+        ('NUMERIC_LITERAL', 16),
+        ('NUMERIC_LITERAL', 255),
+        ('NUMERIC_LITERAL', 0.0125),
+        ('NUMERIC_LITERAL', 42),
+        ('NUMERIC_LITERAL', 1e20)]
+
+    assert type(tokens('42')[0][1]) is int
+    assert type(tokens('42.0')[0][1]) is float
+
+
+def test_lazy_numbers():
+    number, = (token.value for token in Lexer(lazy_numbers=True).tokenize('0.1'))
+
+    assert number.text == '0.1'
+    assert number == 0.1
+    assert str(number.decimal) == '0.1'
+    assert int(Number('0x1F')) == 31
+
+
+def test_negative_literals():
+    statement, = parse('select -5, - -5, -2.5, -(1 + 2) from t limit -1')
+
+    assert statement.select_core.result_column_list[:3] == (-5, 5, -2.5)
+    assert statement.select_core.result_column_list[3].operator == ('MINUS',)
+    assert statement.limit == (-1, 0)
+
+    cache = ParseCache()
+    cache.parse('select -5, 1 - 2')
+    cached, = cache.parse('select -7, 1 - 4')
+    assert cached.select_core.result_column_list[0] == -7
+    assert cached.select_core.result_column_list[1].operator == ('-',)
+
+    fallback, = parse_insert('insert into t values (-1, abs(2))')
+    assert fallback.values.values[0][0] == -1
+
+    lazy, = Parser().parse(Lexer(lazy_numbers=True).tokenize('select -0x10, -1.5'))
+    assert [number.text for number in lazy.select_core.result_column_list] == ['-0x10', '-1.5']
+    assert [number.value for number in lazy.select_core.result_column_list] == [-16, -1.5]
+    assert lazy.select_core.result_column_list[0].decimal == -16
@@ -0,0 +1,81 @@
+from sqlton import parse, bind, SqltonSyntaxError
+from sqlton.ast import Parameter, Values
+
+
+def test_parameter_numbering():
+    ast, = parse('select * from t where a = ? and b = ?5 and c = ? limit ?')
+
+    where = ast.select_core.where
+    assert where.a.a.b == Parameter(1)
+    assert where.a.b.b == Parameter(5)
+    assert where.b.b == Parameter(6)
+    assert ast.limit == (Parameter(7), 0)
+
+
+def test_parameter_numbering_named():
+    ast, = parse('select ? from t where a = :a and b = ? and c = :a and d = @a and e = ?')
+
+    where = ast.select_core.where
+    assert ast.select_core.result_column_list[0] == Parameter(1)
+    assert where.a.a.a.a.b == Parameter(':a', 2)
+    assert where.a.a.a.b.b == Parameter(3)
+    assert where.a.b.b == Parameter('@a', 4)
+    assert where.b.b == Parameter(5)
+
+
+def test_parameter_zero():
+    try:
+        parse('select ?0', on_error='raise')
+    except SqltonSyntaxError:
+        pass
+    else:
+        assert False
+
+
+def test_parameter_named():
+    ast, = parse('select * from t where a = :a or b in (@b, $c)')
+
+    where = ast.select_core.where
+    assert where.a.b == Parameter(':a', 1)
+    assert where.b.b == (Parameter('@b', 2), Parameter('$c', 3))
+
+
+def test_parameter_prefixes():
+    ast, = parse('select :x, @x, $x, :x')
+
+    assert ast.select_core.result_column_list == (Parameter(':x', 1),
+                                                  Parameter('@x', 2),
+                                                  Parameter('$x', 3),
+                                                  Parameter(':x', 1))
+
+
+def test_bind_sequence():
+    template, = parse('insert into t (a, b) values (?, ?)')
+
+    assert bind(template, (1, 'x')).values == Values(((1, 'x'),))
+    assert bind(template, (2, 'y')).values == Values(((2, 'y'),))
+    assert template.values == Values(((Parameter(1), Parameter(2)),))
+
+
+def test_bind_mapping():
+    template, = parse('update t set name = :name where id = :id')
+    ast = bind(template, {'name': 'x', 'id': 3})
+
+    assert ast.assignments == ((('name',), 'x'),)
+    assert ast.where.b == 3
+    print(ast)
+
+
+def test_bind_named_by_index():
+    template, = parse('select * from t where a = :x and b = ? and c = @y and d = :x')
+    ast = bind(template, (5, 6, 7))
+
+    assert ast.select_core.where.a.a.a.b == 5
+    assert ast.select_core.where.a.a.b.b == 6
+    assert ast.select_core.where.a.b.b == 7
+    assert ast.select_core.where.b.b == 5
+
+    ast = bind(template, {'x': 1, 2: 2, '@y': 3})
+    assert ast.select_core.where.a.a.b.b == 2
+    assert ast.select_core.where.a.b.b == 3
+    assert ast.select_core.where.b.b == 1
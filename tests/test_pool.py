@@ -0,0 +1,41 @@
+from threading import Thread
+from sqlton import ParserPool
+from sqlton.ast import Select
+
+
+def test_pool_reuse():
+    pool = ParserPool()
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+
+
+def test_pool_nested():
+    pool = ParserPool()
+
+    with pool.acquire() as first:
+        with pool.acquire() as second:
+            assert first is not second
+
+
+def test_pool_threads():
+    pool = ParserPool(size=4)
+    failures = []
+
+    def work(index):
+        for value in range(200):
+            ast, = pool.parse(f'select a from t{index} where b = {value}')
+            if ast.select_core.table_list[0].name != f't{index}' or ast.select_core.where.b != value:
+                failures.append((index, value))
+
+    threads = [Thread(target=work, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not failures
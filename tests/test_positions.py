@@ -0,0 +1,49 @@
+from sqlton.parser import Lexer, Parser
+
+
+def parse(text):
+    parser = Parser(positions=True)
+    statements = parser.parse(Lexer().tokenize(text))
+    return statements, parser.positions
+
+
+def source(text, positions, node):
+    start, end = positions[node]
+    return text[start:end]
+
+
+def test_positions_nodes():
+    text = 'select a, b + 1 as c from s.t where x = (1) and y in (2, 3)'
+    (select,), positions = parse(text)
+    core = select.select_core
+    a, alias = core.result_column_list
+
+    assert source(text, positions, select) == text
+    assert source(text, positions, a) == 'a'
+    assert source(text, positions, alias) == 'b + 1 as c'
+    assert source(text, positions, alias.original) == 'b + 1'
+    assert source(text, positions, core.table_list[0]) == 's.t'
+    assert source(text, positions, core.where) == 'x = (1) and y in (2, 3)'
+    assert source(text, positions, core.where.a) == 'x = (1)'
+
+
+def test_positions_statements():
+    text = 'select 1; delete from t where a = 2'
+    (select, delete), positions = parse(text)
+
+    assert source(text, positions, delete) == 'delete from t where a = 2'
+    assert source(text, positions, delete.where) == 'a = 2'
+
+
+def test_positions_leaves():
+    (select,), positions = parse('select 1')
+
+    assert 1 not in positions
+    assert positions.get(1) is None
+
+
+def test_positions_off():
+    parser = Parser()
+    parser.parse(Lexer().tokenize('select 1'))
+
+    assert parser.positions is None
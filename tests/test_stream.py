@@ -0,0 +1,42 @@
+from io import StringIO
+from sqlton import parse
+from sqlton.stream import parse_stream, split_statements
+from sqlton.ast import Select, Insert, Drop
+
+
+def test_split_statements():
+    chunks = ('select "a;', 'b" from t; sel', 'ect `x;y` from u;', ';  ', 'drop table t')
+    assert list(split_statements(chunks)) == ['select "a;b" from t',
+                                              ' select `x;y` from u',
+                                              '',
+                                              '  drop table t']
+
+
+def test_parse_stream():
+    script = '''
+    insert into t (a, b) values (1, ';'), (2, "x");
+    select * from t where b = 'a;b';
+    drop table t;
+    '''
+    statements = list(parse_stream(StringIO(script), chunksize=7))
+
+    assert [type(statement) for statement in statements] == [Insert, Select, Drop]
+    assert statements[0].values.values == parse("insert into t (a, b) values (1, ';'), (2, \"x\")")[0].values.values
+    print(statements)
+
+
+def test_parse_stream_iterable():
+    statements = parse_stream(f'select {index} from t;' for index in range(100))
+
+    assert sum(1 for _ in statements) == 100
+
+
+def test_split_statements_chunk_boundaries():
+    script = "insert into t values ('a;b', \"c'd\");select 1;" * 3
+    expected = list(split_statements([script]))
+
+    for size in range(1, 12):
+        chunks = [script[index:index + size] for index in range(0, len(script), size)]
+        assert list(split_statements(chunks)) == expected
+
+    assert expected[0] == "insert into t values ('a;b', \"c'd\")"
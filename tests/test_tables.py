@@ -0,0 +1,52 @@
+from os import listdir
+from os.path import join
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from sqlton import tables
+from sqlton.parser import Parser
+
+
+def test_tables_round_trip():
+    with TemporaryDirectory() as directory:
+        filename = join(directory, 'parsetab.pickle')
+        dumped = tables.dump(Parser._grammar, Parser._lrtable, filename)
+        loaded = tables.load(Parser._grammar, filename)
+
+    assert loaded == dumped
+    assert loaded.lr_action == Parser._lrtable.lr_action
+
+
+def test_tables_missing():
+    with TemporaryDirectory() as directory:
+        assert tables.load(Parser._grammar, join(directory, 'missing.pickle')) is None
+
+
+def test_tables_disabled():
+    assert tables.load(Parser._grammar, '') is None
+
+
+def test_tables_corrupt():
+    with TemporaryDirectory() as directory:
+        filename = join(directory, 'parsetab.pickle')
+        tables.dump(Parser._grammar, Parser._lrtable, filename)
+
+        with open(filename, 'rb') as file:
+            data = file.read()
+
+        for size in (1, len(data) // 2, len(data) - 1):
+            with open(filename, 'wb') as file:
+                file.write(data[:size])
+
+            assert tables.load(Parser._grammar, filename) is None
+
+
+def test_tables_concurrent_dump():
+    with TemporaryDirectory() as directory:
+        filename = join(directory, 'parsetab.pickle')
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: tables.dump(Parser._grammar, Parser._lrtable, filename),
+                              range(8)))
+
+        assert listdir(directory) == ['parsetab.pickle']
+        assert tables.load(Parser._grammar, filename) is not None
@@ -0,0 +1,61 @@
+from sqlton import parse, unparse
+from sqlton.ast import Column, Operation
+
+statements = ('SELECT * FROM t WHERE a >= 1 AND a <= 2',
+              'SELECT * FROM t WHERE a IS NULL AND b IS NOT NULL',
+              'SELECT CAST(a AS NULL), CAST(a AS REAL), CAST(a AS TEXT), CAST(a AS NUMERIC) FROM t',
+              'WITH c(x) AS NOT MATERIALIZED (SELECT 1), d AS (SELECT 2) SELECT * FROM c',
+              'CREATE TABLE s.t (a INTEGER PRIMARY KEY DESC AUTOINCREMENT, b TEXT, c)',
+              'CREATE TABLE t AS SELECT * FROM u',
+              'SELECT * FROM t NATURAL LEFT OUTER JOIN u ON t.a = u.a JOIN v USING (a, b)',
+              'SELECT * FROM t AS x INDEXED BY i, (SELECT 1) AS s, (a, b), (SELECT 2)',
+              'SELECT a FROM t UNION ALL SELECT b FROM u ORDER BY b LIMIT 3 OFFSET 1',
+              'VALUES (1, 2), (3, 4)',
+              'SELECT count(DISTINCT a ORDER BY b) FILTER (WHERE a > 1), count(*) FROM t',
+              'SELECT a COLLATE nocase FROM t GROUP BY a HAVING count(*) > 1',
+              'SELECT NOT a = 1, EXISTS (SELECT 1), -(1 + 2) * 3, 1 - (2 - 3), 1 - 2 - 3 FROM t',
+              "SELECT a FROM t WHERE b NOT LIKE 'x' AND c NOT IN (SELECT 1) AND d IN ()",
+              'INSERT OR REPLACE INTO s.t AS x (a) SELECT 1 RETURNING a, b',
+              'REPLACE INTO t DEFAULT VALUES',
+              'UPDATE OR IGNORE t SET (a, b) = c, d = 1 FROM u WHERE x RETURNING *',
+              'DELETE FROM t AS x WHERE 1 RETURNING a AS b',
+              'SELECT t.*, s.t.*, s.t.c FROM t ORDER BY a ASC NULLS FIRST, b DESC',
+              'SELECT a AS `select`, b AS `weird name` FROM `from`',
+              'SELECT a FROM t WHERE (a = 1 OR b = 2) AND c = 3 OR NOT d = 4',
+              'SELECT * FROM t WHERE a = ?1 AND b = :name',
+              'DROP TABLE IF EXISTS s.t; DROP TABLE t')
+
+
+def test_round_trip():
+    for statement in statements:
+        ast = parse(statement)
+        assert unparse(ast) == statement, statement
+        assert repr(parse(unparse(ast))) == repr(ast)
+
+
+def test_canonical():
+    assert (unparse(parse('select   A,b from T   where x=1   and y = "z"')) ==
+            unparse(parse("SELECT A, b FROM T WHERE x = 1 AND y = 'z'")))
+
+
+def test_minify():
+    ast = parse('select a, b from t where a = 1 and b - 1 > 2')
+
+    assert unparse(ast, minify=True) == 'SELECT a,b FROM t WHERE a=1 AND b - 1>2'
+
+
+def test_rewrite():
+    ast, = parse('select * from person where age > 18')
+    ast.limit = (100, 0)
+    ast.select_core.where = Operation(('AND',),
+                                      ast.select_core.where,
+                                      Operation(('=',), Column('tenant'), 42))
+
+    assert unparse(ast) == 'SELECT * FROM person WHERE age > 18 AND tenant = 42 LIMIT 100'
+
+
+def test_deep_chain():
+    statement = 'SELECT * FROM t WHERE ' + ' AND '.join(f'a <> {index}' for index in range(2000))
+
+    assert unparse(parse(statement)) == statement
+    assert unparse(parse('SELECT ' + ' - '.join(map(str, range(2000))))).count(' - ') == 1999
@@ -0,0 +1,52 @@
+from sqlton import parse
+from sqlton.vectorize import mask
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def where(expression):
+    ast, = parse(f'select * from t where {expression}')
+    return ast.select_core.where
+
+
+def selected(expression, batch):
+    return mask(where(expression), batch).tolist()
+
+
+def batch():
+    return {'a': numpy.array([1, 2, 3, 4]),
+            'b': numpy.ma.array([1.0, 2.0, 3.0, 4.0], mask=[False, True, False, False]),
+            's': numpy.array(['x', None, 'z', 'x'], dtype=object),
+            't.a': numpy.array([9, 9, 9, 9])}
+
+
+def test_vectorize_comparisons():
+    if numpy is None:
+        return
+
+    assert selected('a > 2', batch()) == [False, False, True, True]
+    assert selected('a between 2 and 3', batch()) == [False, True, True, False]
+    assert selected('a * 2 + 1 = 7', batch()) == [False, False, True, False]
+    assert selected('a / 2 = 1', batch()) == [False, True, True, False]
+    assert selected('-2 > a', batch()) == [False, False, False, False]
+    assert selected('s = \'x\'', batch()) == [True, False, False, True]
+    assert selected('t.a = 9', batch()) == [True, True, True, True]
+    assert selected('a in (1, 4)', batch()) == [True, False, False, True]
+
+
+def test_vectorize_nulls():
+    if numpy is None:
+        return
+
+    assert selected('b > 2', batch()) == [False, False, True, True]
+    assert selected('not b > 2', batch()) == [True, False, False, False]
+    assert selected('b > 2 or a = 2', batch()) == [False, True, True, True]
+    assert selected('not (b > 2 and a = 2)', batch()) == [True, False, True, True]
+    assert selected('a not in (1, null)', batch()) == [False, False, False, False]
+    assert selected('a in (b, 4)', batch()) == [True, False, True, True]
+    assert selected('b is null', batch()) == [False, True, False, False]
+    assert selected('s is not null', batch()) == [True, False, True, True]
+    assert selected('a / 0 is null', batch()) == [True, True, True, True]
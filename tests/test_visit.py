@@ -0,0 +1,64 @@
+from sqlton import parse
+from sqlton.ast import Column, Operation, Select
+from sqlton.visit import PRUNE, Visitor, Transformer, walk
+
+
+def chain(depth):
+    return parse('select * from t where ' + ' and '.join(f'c{index} = {index}' for index in range(depth)))[0]
+
+
+class Columns(Visitor):
+    def __init__(self):
+        self.names = []
+
+    def visit_Column(self, node):
+        self.names.append(node.name)
+
+    def visit_Select(self, node):
+        if self.names:
+            return PRUNE
+
+
+class Rename(Transformer):
+    def transform_Column(self, node):
+        return Column(node.name.upper(), node.table)
+
+
+def test_walk():
+    ast, = parse('select a from t where b in (select c from u)')
+    names = [node.name for node in walk(ast) if isinstance(node, Column)]
+
+    assert names == ['a', 'b', 'c']
+
+
+def test_visitor_prune():
+    ast, = parse('select a from t where b in (select c from u)')
+    visitor = Columns()
+    visitor.visit(ast)
+
+    assert visitor.names == ['a', 'b']
+
+
+def test_transformer_identity():
+    ast, = parse('select a from t where b = 1 limit 3')
+    renamed = Rename().transform(ast)
+
+    assert renamed.select_core.where.a == Column('B')
+    assert renamed.limit is ast.limit
+    assert renamed.select_core.table_list is ast.select_core.table_list
+
+
+def test_deep_expression():
+    ast = chain(10000)
+    visitor = Columns()
+    visitor.visit(ast)
+
+    assert len(visitor.names) == 10000
+
+    renamed = Rename().transform(ast)
+    operation = renamed.select_core.where
+
+    while isinstance(operation.a, Operation) and operation.operator == ('AND',):
+        operation = operation.a
+
+    assert operation.a == Column('C0')